@@ -5,299 +5,309 @@ from langgraph.graph.message import add_messages
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 from langchain_community.agent_toolkits import PlayWrightBrowserToolkit
-from langchain_community.tools.playwright.utils import create_async_playwright_browser
-from langgraph.prebuilt import ToolNode
-import nest_asyncio
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+import asyncio
+import json
+import logging
 import os
 import random
+import re
 from dotenv import load_dotenv
+from functools import lru_cache
 
 from reddit.models import POI, POIList
-from reddit.geocoding import geocode_with_fallback
-from reddit.url_extraction import extract_reddit_post_urls_from_playwright, extract_reddit_post_urls_from_text
-from reddit.search_terms import get_random_search_term
+from reddit.poi_merging import merge_duplicate_pois, poi_name_key
+from reddit.geocoding import geocode_address, geocode_with_fallback
+from reddit.url_extraction import extract_reddit_post_urls_from_playwright, extract_reddit_post_urls_from_text, get_post_subreddit, select_relevant_post_urls
+from reddit.search_terms import build_search_url, get_random_search_term
+from reddit.content import strip_reddit_boilerplate, truncate_to_tokens
+from reddit.cache import acache_get, acache_set, make_cache_key
+from reddit.fetching import POST_PAGE_CACHE, POST_PAGE_CACHE_TTL, extract_post_text, fetch_posts_text, fetch_search_results
+from reddit.http_client import get_http_client
+from utils.location import get_city_bbox
+from reddit.browser import BrowserLease, extract_search_results_text, fetch_posts_html_with_browser, wait_for_reddit_content
 
 load_dotenv(override=True)
-nest_asyncio.apply()
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_MODEL = "gpt-4o-mini"
+
+# Cache namespace for structured POI extraction responses
+POI_EXTRACTION_CACHE = "poi_extraction"
+
+# Search page text and post URLs, reused across runs for an hour
+SEARCH_PAGE_CACHE = "search_page"
+SEARCH_PAGE_CACHE_TTL = 60 * 60
+
+# Scrapes shorter than this are empty or failed pages, not worth an extraction call
+MIN_EXTRACTION_CONTENT_CHARS = 1500
+
+# Upper bound on POIs geocoded concurrently
+MAX_CONCURRENT_GEOCODES = 8
+
+# Words that mark fetched page text as a real Reddit post
+_REDDIT_KEYWORDS_RE = re.compile(r'comments|upvote|downvote|share|award|reply|r/|u/|points|submitted', re.IGNORECASE)
+
+_REDDIT_INDICATORS_RE = re.compile(r'reddit\.com|r/|upvote|downvote|comment|post|OP|edit:|deleted', re.IGNORECASE)
+
+# Reddit markdown link text like [text], and bare URLs, stripped from descriptions
+_BRACKETS_RE = re.compile(r'\[.*?\]')
+_URL_RE = re.compile(r'https?://\S+')
+
+# Place-name patterns for the regex fallback when the LLM finds too few POIs
+_REGEX_PLACE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',
+    r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b',
+    r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b',
+    r'\b[A-Z][a-z]+ (Street|Avenue|Road|Boulevard|Drive|Lane|Place|Court|Terrace|Crescent)\b',
+    r'\b[A-Z][a-z]+ (Park|Museum|Gallery|Theater|Theatre|Cinema|Restaurant|Cafe|Bar|Pub|Club)\b',
+    r'\b[A-Z][a-z]+ (Market|Mall|Centre|Center|Plaza|Square|Building|Tower|Bridge|Station)\b',
+    r'\b[A-Z][a-z]+ (Island|Beach|Trail|Path|Garden|Zoo|Aquarium|Stadium|Arena|Hall)\b',
+    r'\b[A-Z][a-z]+ (Village|Town|District|Area|Neighborhood|Neighbourhood|Quarter|Zone)\b',
+    r'\b[A-Z][a-z]+ (East|West|North|South|Central|Downtown|Uptown|Midtown)\b',
+))
+
+# Exact regex matches that are Reddit UI text or locations too broad to be POIs
+_REGEX_COMMON_WORDS = frozenset({
+    'Reddit', 'Toronto', 'Canada', 'Ontario', 'Personal', 'Please', 'Submit', 'Share', 'Reply', 'Comment',
+    'Post', 'User', 'Member', 'Online', 'Filter', 'Show', 'Hide', 'Sort', 'Best', 'Top', 'New', 'Old',
+    'Controversial', 'Q&A', 'More', 'Less', 'Points', 'Children', 'Permalink', 'Embed', 'Save', 'Parent',
+    'Report', 'Track', 'Me', 'Replies', 'By', 'Open', 'Options'
+})
+
+# Words that disqualify a regex match when any word of it is one of them
+_REGEX_NON_PLACE_WORDS = frozenset({
+    'hello', 'picture', 'discussion', 'filter', 'megathread', 'user', 'agreement',
+    'alerts', 'monthly', 'meetup', 'traditionally', 'pictures', 'rules', 'this', 'all',
+    'show', 'hide', 'sort', 'best', 'top', 'new', 'old', 'controversial', 'q&a', 'more',
+    'less', 'points', 'children', 'permalink', 'embed', 'save', 'parent', 'report',
+    'track', 'reply', 'share', 'replies', 'open', 'comment', 'options', 'submit',
+    'edit', 'delete', 'moderators', 'guidelines'
+})
+
+# Place types that are not a POI on their own
+_REGEX_BARE_PLACE_TYPES = frozenset({
+    'street', 'park', 'road', 'avenue', 'drive', 'lane', 'place', 'court', 'terrace', 'crescent'
+})
+
+# Whole regex matches rejected as POI names
+_REGEX_REJECTED_NAMES = frozenset({
+    'hello', 'picture', 'discussion', 'filter', 'megathread', 'cheap', 'user', 'agreement', 'alerts',
+    'monthly', 'meetup', 'traditionally', 'pictures', 'rules', 'street', 'park', 'gems', 'march',
+    'january', 'december', 'former', 'new', 'york', 'greenwich', 'village', 'sunset', 'playoff',
+    'hockey', 'this', 'all', 'show', 'hide', 'sort', 'best', 'top', 'old', 'controversial', 'q&a',
+    'more', 'less', 'points', 'children', 'permalink', 'embed', 'save', 'parent', 'report', 'track',
+    'reply', 'share', 'replies', 'open', 'comment', 'options', 'submit', 'edit', 'delete',
+    'moderators', 'guidelines'
+})
+
+class RedditState(TypedDict):
+    messages: Annotated[List[Any], add_messages]
+    current_step: str
+    scraped_content: Optional[str]
+    extracted_pois: Optional[List[Any]]
+    city: str
+    subreddit: str
+    search_term: str
+    search_url: str
+    post_urls: Optional[List[str]]
+
+@lru_cache(maxsize=1)
+def _build_poi_extractor(http_client):
+    """Build the structured-output POI extraction chain on the given HTTP client"""
+    llm = ChatOpenAI(model=EXTRACTION_MODEL, temperature=0, http_async_client=http_client)
+    return llm.with_structured_output(POIList)
+
+def get_poi_extractor():
+    """Get the POI extraction chain, sharing the pooled HTTP client of the running loop"""
+    return _build_poi_extractor(get_http_client())
 
 async def get_reddit_pois_direct(city: str, province: str, country: str, lat: float, lng: float) -> list:
     """Direct Reddit scraper using LangGraph with proper async browser tools"""
-    import random
-    
-    print(f"Starting LangGraph Reddit scraper for {city}...")
-    
-    from langchain_community.tools.playwright.utils import create_async_playwright_browser
-    async_browser = create_async_playwright_browser(headless=False)
-    toolkit = PlayWrightBrowserToolkit.from_browser(async_browser=async_browser)
-    tools = toolkit.get_tools()
-    print(f"Got {len(tools)} Playwright tools: {[tool.name for tool in tools]}")
+    logger.info("Starting LangGraph Reddit scraper for %s...", city)
     
-    llm = ChatOpenAI(model="gpt-4o-mini")
+    # Only the browser fallbacks acquire a pooled browser; most runs never need one
+    browser_lease = BrowserLease()
     
-    from langgraph.graph import StateGraph, END
-    from typing import TypedDict, Annotated, List, Any, Optional
-    from langgraph.prebuilt import ToolNode
-    
-    class RedditState(TypedDict):
-        messages: Annotated[List[Any], add_messages]
-        current_step: str
-        scraped_content: Optional[str]
-        extracted_pois: Optional[List[Any]]
-        city: str
-        subreddit: str
-        search_term: str
-    
-    tool_node = ToolNode(tools)
-    
-    async def scrape_reddit_node(state: RedditState) -> RedditState:
+    async def scrape_reddit_node(state: RedditState) -> dict:
         """Navigate to Reddit and scrape content"""
-        print(f"🔍 Scraping r/{state['subreddit']} for things to do in {state['city']}...")
-        
-        search_urls = [
-            f"https://old.reddit.com/r/{state['subreddit']}/search/?q={state['search_term']}&restrict_sr=on&sort=relevance&t=all",
-            f"https://old.reddit.com/r/{state['subreddit']}/search/?q={state['search_term']}&restrict_sr=on&sort=hot&t=all",
-            f"https://old.reddit.com/r/{state['subreddit']}/search/?q={state['search_term']}&restrict_sr=on&sort=new&t=all",
-            f"https://old.reddit.com/r/{state['subreddit']}/top/?q={state['search_term']}&restrict_sr=on&t=all"
-        ]
-        
-        search_url = search_urls[0]
-        
-        navigate_tool = next(tool for tool in tools if tool.name == "navigate_browser")
-        extract_tool = next(tool for tool in tools if tool.name == "extract_text")
-        
-        print(f"🌐 Navigating to: {search_url}")
-        await navigate_tool.arun({"url": search_url})
-        
-        import asyncio
-        await asyncio.sleep(5)
+        logger.info("🔍 Scraping r/%s for things to do in %s...", state['subreddit'], state['city'])
+        
+        search_url = state['search_url']
+        
+        cached = await acache_get(SEARCH_PAGE_CACHE, search_url)
+        if cached is not None:
+            logger.debug("💾 Using cached search results for %s", search_url)
+            cached_page = json.loads(cached)
+            return {
+                "scraped_content": cached_page["content"],
+                "post_urls": cached_page["post_urls"],
+                "current_step": "click_posts"
+            }
+        
+        search_results = await fetch_search_results(state['subreddit'], state['search_term'])
+        if search_results and search_results[1]:
+            content, post_urls = search_results
+            logger.debug("✅ Got %s posts from the JSON search endpoint", len(post_urls))
+        else:
+            logger.warning("⚠️ JSON search returned nothing, falling back to the browser")
+            browser_context = await browser_lease.get_context()
+            tools = PlayWrightBrowserToolkit.from_browser(async_browser=await browser_lease.get_browser()).get_tools()
+            extract_tool = next(tool for tool in tools if tool.name == "extract_text")
+            
+            logger.debug("🌐 Navigating to: %s", search_url)
+            page = browser_context.pages[0] if browser_context.pages else await browser_context.new_page()
+            # Results are server-rendered, so there's no need to wait for images and ads to finish loading
+            try:
+                await page.goto(search_url, wait_until="domcontentloaded")
+                await wait_for_reddit_content(page)
+            except PlaywrightTimeoutError:
+                logger.warning("⚠️ Timed out loading %s, extracting whatever has rendered", search_url)
+            content = await extract_search_results_text(page)
+            if not content:
+                logger.warning("⚠️ No search results found via selectors, extracting full page text")
+                content = await extract_tool.arun({})
+            logger.debug("📄 Initial search results length: %s characters", len(content))
+            
+            logger.debug("🔍 Using direct Playwright method to extract Reddit post URLs...")
+            post_urls = await extract_reddit_post_urls_from_playwright(page, target_subreddit=state['subreddit'])
+            
+            if post_urls:
+                logger.debug("✅ Successfully extracted %s Reddit post URLs using Playwright", len(post_urls))
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, url in enumerate(post_urls[:5]):
+                        logger.debug("  %s. %s (subreddit: r/%s)", i+1, url, get_post_subreddit(url) or "unknown")
+            else:
+                logger.warning("❌ No URLs found with direct Playwright method")
+                
+                logger.debug("🔄 Fallback: Extracting from page content...")
+                page_content = await extract_tool.arun({})
+                post_urls = extract_reddit_post_urls_from_text(page_content, target_subreddit=state['subreddit'])
+                logger.debug("✅ Extracted %s URLs from page content", len(post_urls))
         
-        content = await extract_tool.arun({})
-        print(f"📄 Initial search results length: {len(content)} characters")
+        if content and post_urls:
+            await acache_set(
+                SEARCH_PAGE_CACHE, search_url,
+                json.dumps({"content": content, "post_urls": post_urls}),
+                ttl=SEARCH_PAGE_CACHE_TTL
+            )
         
         return {
-            **state,
             "scraped_content": content,
+            "post_urls": post_urls,
             "current_step": "click_posts"
         }
     
-    async def click_posts_node(state: RedditState) -> RedditState:
+    async def click_posts_node(state: RedditState) -> dict:
         """Click into individual Reddit posts to get detailed content"""
-        print("🖱️ Clicking into individual Reddit posts to get detailed content...")
-        
-        import asyncio
-        
-        try:
-            click_tool = next(tool for tool in tools if tool.name == "click_element")
-            extract_tool = next(tool for tool in tools if tool.name == "extract_text")
-            navigate_tool = next(tool for tool in tools if tool.name == "navigate_browser")
-            current_webpage_tool = next(tool for tool in tools if tool.name == "current_webpage")
-            print("✅ Found all required tools")
-        except StopIteration as e:
-            print(f"❌ Required tool not found: {e}")
-            return {**state, "scraped_content": state.get("scraped_content", ""), "current_step": "extract_pois"}
+        logger.debug("🖱️ Clicking into individual Reddit posts to get detailed content...")
         
         detailed_content = []
-        search_url = f"https://old.reddit.com/r/{state['subreddit']}/search/?q={state['search_term']}&restrict_sr=on&sort=relevance&t=all"
         
         try:
-            print("⏳ Waiting for page to fully load...")
-            await asyncio.sleep(5)
-            
-            current_url = await current_webpage_tool.arun({})
-            print(f"📍 Current URL: {current_url}")
-            
-            print("⏳ Waiting for posts to load...")
-            await asyncio.sleep(3)
-            
-            page = None
-            if async_browser.contexts:
-                context = async_browser.contexts[0]
-                if context.pages:
-                    page = context.pages[0]
-            
-            if not page:
-                print("❌ No page available for direct Playwright access")
-                return {**state, "scraped_content": state.get("scraped_content", ""), "current_step": "extract_pois"}
-            
-            print("🔍 Using direct Playwright method to extract Reddit post URLs...")
-            post_urls = await extract_reddit_post_urls_from_playwright(page, target_subreddit=state['subreddit'])
-            
-            if post_urls:
-                print(f"✅ Successfully extracted {len(post_urls)} Reddit post URLs using Playwright")
-                for i, url in enumerate(post_urls[:5]):
-                    subreddit_in_url = "unknown"
-                    if "/r/" in url:
-                        subreddit_in_url = url.split("/r/")[1].split("/")[0]
-                    print(f"  {i+1}. {url} (subreddit: r/{subreddit_in_url})")
-            else:
-                print("❌ No URLs found with direct Playwright method")
-                
-                print("🔄 Fallback: Extracting from page content...")
-                page_content = await extract_tool.arun({})
-                post_urls = extract_reddit_post_urls_from_text(page_content, target_subreddit=state['subreddit'])
-                print(f"✅ Extracted {len(post_urls)} URLs from page content")
+            post_urls = state.get("post_urls") or []
             
             if post_urls and len(post_urls) > 0:
+                target_subreddit = state['subreddit'].lower()
                 filtered_urls = []
                 for url in post_urls:
-                    if f"/r/{state['subreddit']}/comments/" in url:
+                    subreddit_in_url = get_post_subreddit(url)
+                    if subreddit_in_url and subreddit_in_url.lower() == target_subreddit:
                         filtered_urls.append(url)
                     else:
-                        print(f"⚠️ Filtered out URL from wrong subreddit: {url}")
+                        logger.debug("⚠️ Filtered out URL from wrong subreddit: %s", url)
                 
                 if filtered_urls:
-                    print(f"✅ Found {len(filtered_urls)} Reddit post URLs from r/{state['subreddit']}")
+                    logger.debug("✅ Found %s Reddit post URLs from r/%s", len(filtered_urls), state['subreddit'])
                     # Remove duplicates and take first 10 unique URLs
                     unique_urls = list(dict.fromkeys(filtered_urls))  # Preserves order while removing duplicates
                     candidate_urls = unique_urls[:10]
-                    print(f"🔍 After deduplication: {len(candidate_urls)} unique URLs")
+                    logger.debug("🔍 After deduplication: %s unique URLs", len(candidate_urls))
                 else:
-                    print(f"❌ No URLs found from r/{state['subreddit']} after filtering")
+                    logger.warning("❌ No URLs found from r/%s after filtering", state['subreddit'])
                     candidate_urls = []
-                print(f"🔍 Presenting first {len(candidate_urls)} URLs to LLM for relevance selection...")
-                
-                url_selection_prompt = f"""
-                You are analyzing Reddit post URLs to find the most relevant ones for discovering fun and interesting places in {state['city']}.
                 
-                Your goal is to find posts that are most likely to contain:
-                - People asking about or recommending cool places to go
-                - Discussions about fun areas, neighborhoods, or spots
-                - User experiences and recommendations about places they enjoyed
-                - Local insights about interesting locations
-                - Also posts that mention nice views and places to see the city
+                selected_urls = select_relevant_post_urls(candidate_urls)
+                logger.debug("✅ Selected %s most relevant URLs by slug:", len(selected_urls))
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, url in enumerate(selected_urls):
+                        logger.debug("  %s. %s", i+1, url)
                 
-                Here are the Reddit post URLs to analyze:
-                {chr(10).join([f"{i+1}. {url}" for i, url in enumerate(candidate_urls)])}
+                logger.debug("🌐 Fetching %s posts concurrently...", len(selected_urls))
+                post_contents = await fetch_posts_text(selected_urls)
                 
-                Select the 5 most relevant URLs for finding fun places. Consider:
-                - URLs that seem to be about exploring or discovering places
-                - URLs that appear to be community discussions about cool spots
-                - URLs that mention specific areas, neighborhoods, or types of places
-                - URLs that look like people sharing experiences or asking for recommendations
-                
-                Return only the numbers of the 5 most relevant URLs (e.g., "1, 3, 5, 7, 9").
-                """
-                
-                try:
-                    from langchain_openai import ChatOpenAI
-                    selection_llm = ChatOpenAI(model="gpt-4o-mini")
-                    selection_response = await selection_llm.ainvoke(url_selection_prompt)
-                    
-                    response_text = selection_response.content
-                    print(f"🤖 LLM selection response: {response_text}")
-                    
-                    import re
-                    selected_numbers = re.findall(r'\d+', response_text)
-                    selected_indices = [int(num) - 1 for num in selected_numbers if 0 <= int(num) - 1 < len(candidate_urls)]
-                    
-                    selected_indices = list(set(selected_indices))[:5]  # Remove duplicates and limit to 5
-                    
-                    if selected_indices:
-                        selected_urls = [candidate_urls[i] for i in selected_indices]
-                        # Double-check for duplicates in selected URLs
-                        unique_selected_urls = list(dict.fromkeys(selected_urls))
-                        if len(unique_selected_urls) < len(selected_urls):
-                            print(f"⚠️ Removed {len(selected_urls) - len(unique_selected_urls)} duplicate URLs from selection")
-                            selected_urls = unique_selected_urls
-                        
-                        print(f"✅ LLM selected {len(selected_urls)} most relevant URLs:")
-                        for i, url in enumerate(selected_urls):
-                            print(f"  {i+1}. {url}")
-                    else:
-                        print("⚠️ LLM selection failed, using first 5 URLs")
-                        selected_urls = candidate_urls[:5]
-                        
-                except Exception as e:
-                    print(f"❌ Error with LLM URL selection: {e}")
-                    print("⚠️ Falling back to first 5 URLs")
-                    selected_urls = candidate_urls[:5]
+                failed_indices = [i for i, post_content in enumerate(post_contents) if not post_content]
+                if failed_indices:
+                    failed_urls = [selected_urls[i] for i in failed_indices]
+                    logger.debug("🌐 Loading %s posts in the browser after HTTP fetch failed...", len(failed_urls))
+                    browser_pages = await fetch_posts_html_with_browser(await browser_lease.get_browser(), failed_urls)
+                    for i, post_url, post_html in zip(failed_indices, failed_urls, browser_pages):
+                        post_content = extract_post_text(post_html) if post_html else None
+                        if post_content:
+                            await acache_set(POST_PAGE_CACHE, post_url, post_content, ttl=POST_PAGE_CACHE_TTL)
+                            post_contents[i] = post_content
                 
-                for i, post_url in enumerate(selected_urls):
-                    try:
-                        print(f"🌐 Navigating to post {i+1}: {post_url[:60]}...")
-                        
-                        await navigate_tool.arun({"url": post_url})
-                        await asyncio.sleep(4)
-                        
-                        new_url = await current_webpage_tool.arun({})
-                        print(f"  📍 Actually navigated to: {new_url}")
-                        
-                        if "/comments/" in new_url:
-                            print(f"  ✅ Successfully navigated to post page!")
-                            
-                            print(f"  📄 Extracting content from post {i+1}...")
-                            post_content = await extract_tool.arun({})
-                            
-                            if post_content and len(post_content) > 500:
-                                reddit_keywords = ['comments', 'upvote', 'downvote', 'share', 'award', 'reply', 'r/', 'u/', 'points', 'submitted']
-                                if any(keyword in post_content.lower() for keyword in reddit_keywords):
-                                    detailed_content.append(f"=== POST {i+1} CONTENT ===\n{post_content[:4000]}\n")
-                                    print(f"  ✅ Extracted {len(post_content)} characters from post {i+1}")
-                                else:
-                                    print(f"  ⚠️ Post {i+1} content doesn't look like Reddit")
-                            else:
-                                print(f"  ⚠️ Post {i+1} had insufficient content")
+                for i, post_content in enumerate(post_contents):
+                    if post_content and len(post_content) > 500:
+                        if _REDDIT_KEYWORDS_RE.search(post_content):
+                            detailed_content.append(f"=== POST {i+1} CONTENT ===\n{post_content[:4000]}\n")
+                            logger.debug("  ✅ Extracted %s characters from post %s", len(post_content), i+1)
                         else:
-                            print(f"  ❌ Failed to navigate to post page")
-                        
-                        print(f"  🔙 Going back to search results...")
-                        await navigate_tool.arun({"url": search_url})
-                        await asyncio.sleep(3)
-                        
-                    except Exception as e:
-                        print(f"❌ Error navigating to post {i+1}: {e}")
-                        try:
-                            await navigate_tool.arun({"url": search_url})
-                            await asyncio.sleep(3)
-                        except:
-                            pass
-                        continue
+                            logger.warning("  ⚠️ Post %s content doesn't look like Reddit", i+1)
+                    else:
+                        logger.warning("  ⚠️ Post %s had insufficient content", i+1)
             else:
-                print("❌ No post URLs found - will use search results content only")
+                logger.warning("❌ No post URLs found - will use search results content only")
                 
         except Exception as e:
-            print(f"❌ Major error in click_posts_node: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Major error in click_posts_node: %s", e)
         
         if detailed_content:
             all_content = state.get("scraped_content", "") + "\n\n=== DETAILED POST CONTENT ===\n" + "\n".join(detailed_content)
-            print(f"✅ Total content extracted: {len(all_content)} characters from {len(detailed_content)} posts")
+            logger.info("✅ Total content extracted: %s characters from %s posts", len(all_content), len(detailed_content))
         else:
-            print("❌ No detailed content extracted from posts")
+            logger.warning("❌ No detailed content extracted from posts")
             all_content = state.get("scraped_content", "")
             
             if not all_content:
-                print("⚠️ No content at all - using fallback")
+                logger.warning("⚠️ No content at all - using fallback")
                 all_content = f"Search results from r/{state['subreddit']} for {state['search_term']}"
         
         return {
-            **state,
             "scraped_content": all_content,
             "current_step": "extract_pois"
         }
     
-    async def extract_pois_node(state: RedditState) -> RedditState:
-        """Extract POIs from scraped content"""
+    def route_after_click_posts(state: RedditState) -> str:
+        """Skip extraction entirely when the scraped content isn't from Reddit"""
         content = state.get("scraped_content", "")
         
         if not content:
-            print("❌ No content to extract POIs from")
-            return {**state, "extracted_pois": [], "current_step": "end"}
+            logger.warning("❌ No content to extract POIs from")
+            return END
         
-        reddit_indicators = ['reddit.com', 'r/', 'upvote', 'downvote', 'comment', 'post', 'OP', 'edit:', 'deleted']
-        has_reddit_content = any(indicator in content.lower() for indicator in reddit_indicators)
+        if len(content) < MIN_EXTRACTION_CONTENT_CHARS:
+            logger.warning("❌ Only %s characters scraped, too little to extract POIs from", len(content))
+            return END
         
-        if has_reddit_content:
-            print("✅ Content contains Reddit-specific elements - authentic content detected!")
-        else:
-            print("❌ Content doesn't seem to be from Reddit")
-            return {**state, "extracted_pois": [], "current_step": "end"}
+        if not _REDDIT_INDICATORS_RE.search(content):
+            logger.warning("❌ Content doesn't seem to be from Reddit")
+            return END
         
-        llm_with_structured_output = llm.with_structured_output(POIList)
+        logger.debug("✅ Content contains Reddit-specific elements - authentic content detected!")
+        return "extract_pois"
+    
+    async def extract_pois_node(state: RedditState) -> dict:
+        """Extract POIs from scraped content"""
+        content = state.get("scraped_content", "")
+        
+        cleaned_content = strip_reddit_boilerplate(content)
+        truncated_content = truncate_to_tokens(cleaned_content)
+        logger.debug("📄 Sending %s of %s characters to the LLM", len(truncated_content), len(content))
         
         extract_messages = [
-            SystemMessage(content=f"""You are analyzing Reddit content to find COOL PLACES that people recommend visiting.
+            SystemMessage(content="""You are analyzing Reddit content to find COOL PLACES that people recommend visiting.
 
 GOAL: Find ALL the interesting, fun, and cool places that Reddit users recommend visiting.
 
@@ -333,13 +343,14 @@ For each place, provide:
 2. A brief description based on what's said about it
 3. The category
 4. The specific Reddit context where it's mentioned (the actual text that mentions this place) - THIS MUST BE THE FULL CONTEXT, NOT JUST THE PLACE NAME
+5. inline_address: if the Reddit content mentions a street address or intersection for the place, copy it exactly; otherwise leave it null
 
 Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough."""),
-            HumanMessage(content=f"""Find ALL COOL PLACES that people recommend visiting.
+            HumanMessage(content=f"""Find ALL COOL PLACES in {state['city']} that people recommend visiting.
 
 Here is the Reddit content to analyze:
 
-{content[:12000]}
+{truncated_content}
 
 IMPORTANT: For each place you find, make sure to capture the FULL CONTEXT from the Reddit discussion. Include:
 - What people specifically say about the place
@@ -350,93 +361,51 @@ IMPORTANT: For each place you find, make sure to capture the FULL CONTEXT from t
 - CRITICAL: Only use the exact words from Reddit users - do not generate or create any text
 - The reddit_context must be authentic Reddit content, not AI-generated descriptions
 - IMPORTANT: Skip any place where you can't find genuine Reddit user comments about it
-- Quality over quantity - better to have fewer authentic POIs than more fake ones
-
-Extract EVERY SINGLE PLACE mentioned in this content, including:
-- Restaurants, cafes, bars, food spots, eateries, diners, food trucks
-- Museums, galleries, cultural venues, theaters, cinemas, concert halls
-- Parks, trails, outdoor spaces, gardens, beaches, hiking spots
-- Shopping centers, markets, boutiques, malls, stores, shops
-- Entertainment venues, clubs, pubs, lounges, arcades, game rooms
-- Tourist attractions, landmarks, monuments, buildings, towers
-- Local businesses, services, spas, salons, gyms, fitness centers
-- Neighborhoods, districts, areas, zones, quarters, villages
-- Streets, avenues, roads, intersections that people mention as destinations
-- Any specific place names, business names, or locations that people talk about positively
-
-BE EXTREMELY LIBERAL - if someone mentions a place name in a positive context, extract it. Don't be conservative. Extract as many places as possible.
-
-For each place, provide:
-1. The exact name as mentioned
-2. A brief description based on what's said about it
-3. The category
-4. The specific Reddit context where it's mentioned (the actual text that mentions this place) - INCLUDE THE FULL CONTEXT
-
-Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
-        ]
-        
-        pois_response = await llm_with_structured_output.ainvoke(extract_messages)
-        pois = pois_response.pois
-        print(f"Extracted {len(pois)} POIs: {[poi.name for poi in pois]}")
-        
-        print("🔍 Running aggressive regex extraction as fallback...")
-        import re
-        
-        capitalized_patterns = [
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b',
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+\b',
-        ]
-        
-        place_indicators = [
-            r'\b[A-Z][a-z]+ (Street|Avenue|Road|Boulevard|Drive|Lane|Place|Court|Terrace|Crescent)\b',
-            r'\b[A-Z][a-z]+ (Park|Museum|Gallery|Theater|Theatre|Cinema|Restaurant|Cafe|Bar|Pub|Club)\b',
-            r'\b[A-Z][a-z]+ (Market|Mall|Centre|Center|Plaza|Square|Building|Tower|Bridge|Station)\b',
-            r'\b[A-Z][a-z]+ (Island|Beach|Trail|Path|Garden|Zoo|Aquarium|Stadium|Arena|Hall)\b',
+- Quality over quantity - better to have fewer authentic POIs than more fake ones""")
         ]
         
-        neighborhood_patterns = [
-            r'\b[A-Z][a-z]+ (Village|Town|District|Area|Neighborhood|Neighbourhood|Quarter|Zone)\b',
-            r'\b[A-Z][a-z]+ (East|West|North|South|Central|Downtown|Uptown|Midtown)\b',
-        ]
-        
-        all_patterns = capitalized_patterns + place_indicators + neighborhood_patterns
-        
-        found_places = set()
-        for pattern in all_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = ' '.join(match)
-                common_words = ['Reddit', 'Toronto', 'Canada', 'Ontario', 'Personal', 'Please', 'Submit', 'Share', 'Reply', 'Comment', 'Post', 'User', 'Member', 'Online', 'Filter', 'Show', 'Hide', 'Sort', 'Best', 'Top', 'New', 'Old', 'Controversial', 'Q&A', 'More', 'Less', 'Points', 'Children', 'Permalink', 'Embed', 'Save', 'Parent', 'Report', 'Track', 'Me', 'Reply', 'Share', 'More', 'Replies', 'Sort', 'By', 'Best', 'Top', 'New', 'Controversial', 'Old', 'Q&A', 'Open', 'Comment', 'Options', 'Best', 'Top', 'New', 'Controversial', 'Old', 'Q&A']
-                if match not in common_words and len(match) > 3:
-                    found_places.add(match)
-        
-        print(f"🔍 Regex found {len(found_places)} additional potential places")
-        
-        if len(pois) < 5 and found_places:
-            print(f"⚠️ LLM only found {len(pois)} POIs, using regex results as backup...")
+        cache_key = make_cache_key(
+            EXTRACTION_MODEL,
+            json.dumps([[message.type, message.content] for message in extract_messages])
+        )
+        cached_response = await acache_get(POI_EXTRACTION_CACHE, cache_key)
+        if cached_response is not None:
+            logger.debug("💾 Using cached POI extraction for identical content")
+            pois_response = POIList.model_validate_json(cached_response)
+        else:
+            pois_response = await get_poi_extractor().ainvoke(extract_messages)
+            await acache_set(POI_EXTRACTION_CACHE, cache_key, pois_response.model_dump_json())
+        pois = merge_duplicate_pois(pois_response.pois)
+        llm_poi_count = len(pois)
+        logger.info("Extracted %s POIs: %s", len(pois), [poi.name for poi in pois])
+        
+        if len(pois) < 5:
+            logger.warning("⚠️ LLM only found %s POIs, running aggressive regex extraction as fallback...", len(pois))
+            
+            found_places = set()
+            for pattern in _REGEX_PLACE_PATTERNS:
+                for match in pattern.findall(cleaned_content):
+                    if isinstance(match, tuple):
+                        match = ' '.join(match)
+                    if match not in _REGEX_COMMON_WORDS and len(match) > 3:
+                        found_places.add(match)
+            
+            logger.debug("🔍 Regex found %s additional potential places", len(found_places))
+            
+            existing_names = {poi_name_key(poi.name) for poi in pois}
             for place_name in list(found_places)[:20]:
-                if not any(poi.name.lower() == place_name.lower() for poi in pois):
-                    non_place_words = [
-                        'hello', 'picture', 'discussion', 'filter', 'megathread', 'user', 'agreement', 
-                        'alerts', 'monthly', 'meetup', 'traditionally', 'pictures', 'rules', 'this', 'all', 
-                        'show', 'hide', 'sort', 'best', 'top', 'new', 'old', 'controversial', 'q&a', 'more', 
-                        'less', 'points', 'children', 'permalink', 'embed', 'save', 'parent', 'report', 
-                        'track', 'reply', 'share', 'replies', 'open', 'comment', 'options', 'submit', 
-                        'edit', 'delete', 'moderators', 'guidelines'
-                    ]
-                    
-                    if any(word in place_name.lower() for word in non_place_words):
-                        continue
-                        
-                    if len(place_name.split()) == 1 and place_name.lower() in ['street', 'park', 'road', 'avenue', 'drive', 'lane', 'place', 'court', 'terrace', 'crescent']:
+                lowered_name = place_name.lower()
+                name_key = poi_name_key(place_name)
+                if name_key not in existing_names:
+                    if not _REGEX_NON_PLACE_WORDS.isdisjoint(lowered_name.split()):
                         continue
-                        
-                    if place_name.lower() in ['hello', 'picture', 'discussion', 'filter', 'megathread', 'cheap', 'user', 'agreement', 'alerts', 'monthly', 'meetup', 'traditionally', 'pictures', 'rules', 'street', 'park', 'gems', 'march', 'january', 'december', 'former', 'new', 'york', 'greenwich', 'village', 'sunset', 'playoff', 'hockey', 'this', 'all', 'show', 'hide', 'sort', 'best', 'top', 'new', 'old', 'controversial', 'q&a', 'more', 'less', 'points', 'children', 'permalink', 'embed', 'save', 'parent', 'report', 'track', 'reply', 'share', 'replies', 'open', 'comment', 'options', 'submit', 'edit', 'delete', 'moderators', 'guidelines']:
+                    
+                    if len(place_name.split()) == 1 and lowered_name in _REGEX_BARE_PLACE_TYPES:
                         continue
                     
-                    from reddit.models import POI
+                    if lowered_name in _REGEX_REJECTED_NAMES:
+                        continue
+                
                     regex_poi = POI(
                         name=place_name,
                         description=f"Place mentioned in Reddit discussions",
@@ -444,37 +413,35 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
                         reddit_context=f"Mentioned in Reddit content: {place_name}"
                     )
                     pois.append(regex_poi)
-                    print(f"➕ Added regex POI: {place_name}")
+                    existing_names.add(name_key)
+                    logger.debug("➕ Added regex POI: %s", place_name)
         
-        print(f"✅ Final result: {len(pois)} POIs (LLM: {len(pois_response.pois)}, Regex additions: {len(pois) - len(pois_response.pois)})")
+        logger.info("✅ Final result: %s POIs (LLM: %s, Regex additions: %s)", len(pois), llm_poi_count, len(pois) - llm_poi_count)
         
         return {
-            **state,
             "extracted_pois": pois,
             "current_step": "create_descriptions"
         }
 
-    async def create_descriptions_node(state: RedditState) -> RedditState:
+    async def create_descriptions_node(state: RedditState) -> dict:
         """Create descriptions using the actual reddit_context found during POI extraction"""
-        print("✍️ Creating descriptions from actual Reddit context...")
+        logger.debug("✍️ Creating descriptions from actual Reddit context...")
         
         pois = state.get("extracted_pois", [])
         if not pois:
-            print("❌ No POIs to create descriptions for")
-            return {**state, "extracted_pois": [], "current_step": "end"}
+            logger.warning("❌ No POIs to create descriptions for")
+            return {"extracted_pois": [], "current_step": "end"}
         
-        print(f"🔍 Creating descriptions for {len(pois)} POIs using their reddit_context...")
+        logger.debug("🔍 Creating descriptions for %s POIs using their reddit_context...", len(pois))
         
         for poi in pois:
             try:
                 place_name = poi.name
                 
                 if hasattr(poi, 'reddit_context') and poi.reddit_context:
-                    import re
-                    
                     context = poi.reddit_context.strip()
-                    context = re.sub(r'\[.*?\]', '', context)  # Remove Reddit formatting like [text]
-                    context = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', context)  # Remove URLs
+                    context = _BRACKETS_RE.sub('', context)  # Remove Reddit formatting like [text]
+                    context = _URL_RE.sub('', context)  # Remove URLs
                     
                     # COMMENTED OUT: Sentence splitting logic - using full context instead
                     # sentences = re.split(r'[.!?]+', context)
@@ -515,7 +482,7 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
                     if len(context) > 500:
                         context = context[:500] + "..."
                     poi.description = context
-                    print(f"✅ Used full context for {place_name}: {context[:80]}...")
+                    logger.debug("✅ Used full context for %s: %s...", place_name, context[:80])
                 
                 if hasattr(poi, 'reddit_context') and poi.reddit_context:
                     if len(poi.description) < 10 or poi.description.lower() in [
@@ -525,16 +492,15 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
                         poi.description = poi.reddit_context[:200] if len(poi.reddit_context) > 200 else poi.reddit_context
                 else:
                     poi.description = f"Popular {poi.category.lower()} mentioned in r/{state['subreddit']} discussions"
-                    print(f"⚠️ No context for {place_name}, using fallback")
+                    logger.warning("⚠️ No context for %s, using fallback", place_name)
                     
             except Exception as e:
-                print(f"❌ Error processing {poi.name}: {e}")
+                logger.error("❌ Error processing %s: %s", poi.name, e)
                 poi.description = f"Popular {poi.category.lower()} in {state['city']}"
         
-        print(f"✅ Created descriptions for {len(pois)} POIs using actual Reddit context")
+        logger.debug("✅ Created descriptions for %s POIs using actual Reddit context", len(pois))
         
         return {
-            **state,
             "extracted_pois": pois,
             "current_step": "end"
         }
@@ -547,7 +513,7 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
     workflow.add_node("create_descriptions", create_descriptions_node)
     
     workflow.add_edge("scrape_reddit", "click_posts")
-    workflow.add_edge("click_posts", "extract_pois")
+    workflow.add_conditional_edges("click_posts", route_after_click_posts, ["extract_pois", END])
     workflow.add_edge("extract_pois", "create_descriptions")
     workflow.add_edge("create_descriptions", END)
     
@@ -559,7 +525,7 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
     
     search_term = get_random_search_term(city)
     
-    print(f"🔍 Using search term: {search_term}")
+    logger.info("🔍 Using search term: %s", search_term)
     
     try:
         initial_state = {
@@ -569,22 +535,37 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
             "extracted_pois": None,
             "city": city,
             "subreddit": subreddit,
-            "search_term": search_term
+            "search_term": search_term,
+            "search_url": build_search_url(subreddit, search_term),
+            "post_urls": None
         }
         
-        print("🤖 Starting LangGraph workflow...")
-        result = await app.ainvoke(initial_state)
+        logger.debug("🤖 Starting LangGraph workflow...")
+        try:
+            result = await app.ainvoke(initial_state)
+        finally:
+            await browser_lease.close()
         
         pois = result.get("extracted_pois", [])
         if not pois:
-            print("❌ No POIs extracted from LangGraph workflow")
+            logger.warning("❌ No POIs extracted from LangGraph workflow")
             return []
         
-        final_pois = []
-        for poi in pois:
-            print(f"🗺️ Geocoding {poi.name}...")
-            
-            coords = geocode_with_fallback(poi.name, city, province, country)
+        # Resolve the city bounds once, off the event loop, so every per-POI bounds check is a cache hit
+        if os.getenv("MAPBOX_ACCESS_TOKEN"):
+            await asyncio.to_thread(get_city_bbox, city)
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_GEOCODES)
+        
+        async def process_poi(poi) -> dict:
+            """Geocode a single POI, falling back to jittered user coordinates"""
+            async with semaphore:
+                logger.debug("🗺️ Geocoding %s...", poi.name)
+                coords = None
+                if poi.inline_address:
+                    coords = await geocode_address(poi.inline_address, city, province, country)
+                if not coords:
+                    coords = await geocode_with_fallback(poi.name, city, province, country)
             
             if coords:
                 poi_output = {
@@ -595,9 +576,9 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
                     "type": "reddit",
                     "radius": 20
                 }
-                print(f"✅ Geocoded {poi.name}: ({coords['lat']}, {coords['lng']})")
+                logger.debug("✅ Geocoded %s: (%s, %s)", poi.name, coords['lat'], coords['lng'])
             else:
-                print(f"⚠️ Geocoding failed for {poi.name}, using fallback coordinates")
+                logger.warning("⚠️ Geocoding failed for %s, using fallback coordinates", poi.name)
                 lat_variation = random.uniform(-0.005, 0.005)
                 lng_variation = random.uniform(-0.005, 0.005)
                 
@@ -610,14 +591,21 @@ Extract AT LEAST 15-20 places if possible. Be comprehensive and thorough.""")
                     "radius": 20
                 }
             
-            final_pois.append(poi_output)
+            return poi_output
+        
+        results = await asyncio.gather(*(process_poi(poi) for poi in pois), return_exceptions=True)
+        
+        final_pois = []
+        for poi, poi_result in zip(pois, results):
+            if isinstance(poi_result, Exception):
+                logger.error("❌ Error geocoding %s: %s", poi.name, poi_result)
+                continue
+            final_pois.append(poi_result)
         
-        print(f"✅ Created {len(final_pois)} Reddit POIs with LangGraph workflow")
+        logger.info("✅ Created %s Reddit POIs with LangGraph workflow", len(final_pois))
         return final_pois
         
     except Exception as e:
-        print(f"❌ Error in LangGraph Reddit scraper: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error in LangGraph Reddit scraper: %s", e)
         return []
 
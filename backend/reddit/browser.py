@@ -0,0 +1,264 @@
+"""
+Pooled Playwright browsers and page helpers for Reddit scraping
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import List, Optional, Set
+from urllib.parse import urlsplit
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from reddit.cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+MAX_BROWSERS = 3
+
+# No GPU is needed for headless text scraping, and /dev/shm is tiny in most containers
+BROWSER_LAUNCH_ARGS = ["--disable-gpu", "--disable-dev-shm-usage"]
+
+# Reddit cookies and local storage carried between runs, so consent and preference state sticks
+STORAGE_STATE_PATH = os.path.join(CACHE_DIR, "reddit_storage_state.json")
+# Serializes writers of STORAGE_STATE_PATH; each write goes to a temp file that replaces it
+_STORAGE_STATE_LOCK = threading.Lock()
+
+# Containers that mark an old.reddit listing or post page as rendered
+READY_SELECTOR = "div.search-result-listing, div.sitetable, div.commentarea"
+READY_TIMEOUT_MS = 8000
+
+# Post pages loaded in parallel browser contexts at once, to stay under Reddit's rate limits
+MAX_CONCURRENT_POST_PAGES = 5
+
+# Only page text is scraped, so these resource types are never downloaded
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet", "beacon", "websocket"})
+
+# Ad and tracking hosts, matched against the request host and its parent domains
+BLOCKED_HOSTS = frozenset({"doubleclick.net", "googletagservices.com", "googlesyndication.com"})
+
+# Runs in the page: title, snippet and meta line of each old.reddit search result
+_SEARCH_RESULTS_JS = """results => results.map(result => [
+    result.querySelector('a.search-title'),
+    result.querySelector('.search-result-meta'),
+    result.querySelector('.search-result-body')
+].filter(Boolean).map(el => el.innerText.trim()).join('\\n'))"""
+
+class BrowserPool:
+    """Hands out headless Chromium browsers, launching at most max_size of them"""
+
+    def __init__(self, max_size: int = MAX_BROWSERS):
+        self.max_size = max_size
+        self._playwright: Optional[Playwright] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._launched = 0
+        # Every live browser, idle or leased out, so close() can reach them all
+        self._browsers: Set[Browser] = set()
+
+    def _bind_to_running_loop(self) -> None:
+        """Reset pool state when used from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._playwright = None
+            self._idle = asyncio.Queue(maxsize=self.max_size)
+            self._lock = asyncio.Lock()
+            self._loop = loop
+            self._launched = 0
+            self._browsers = set()
+
+    async def _launch(self) -> Browser:
+        """Launch a new headless browser, starting Playwright on first use"""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+        logger.debug("🚀 Launched pooled browser (%s/%s)", self._launched + 1, self.max_size)
+        return browser
+
+    def _discard(self, browser: Browser) -> None:
+        """Forget a disconnected browser and free its slot"""
+        logger.warning("⚠️ Discarding disconnected pooled browser")
+        self._browsers.discard(browser)
+        self._launched -= 1
+
+    async def acquire(self) -> Browser:
+        """Take an idle browser, launching one if the pool has room"""
+        self._bind_to_running_loop()
+        while True:
+            async with self._lock:
+                while not self._idle.empty():
+                    browser = self._idle.get_nowait()
+                    if browser.is_connected():
+                        return browser
+                    self._discard(browser)
+
+                if self._launched < self.max_size:
+                    self._launched += 1
+                    try:
+                        browser = await self._launch()
+                    except Exception:
+                        self._launched -= 1
+                        raise
+                    self._browsers.add(browser)
+                    return browser
+
+            browser = await self._idle.get()
+            if browser.is_connected():
+                return browser
+            self._discard(browser)
+
+    async def release(self, browser: Browser) -> None:
+        """Return a browser to the pool, or close it if the pool was closed while it was leased"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        if browser not in self._browsers:
+            await _close_browser(browser)
+        elif browser.is_connected():
+            self._idle.put_nowait(browser)
+        else:
+            self._discard(browser)
+
+    async def close(self) -> None:
+        """Close every launched browser, idle or leased out, and stop Playwright"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        browsers, self._browsers = self._browsers, set()
+        self._launched = 0
+        for browser in browsers:
+            await _close_browser(browser)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+async def _close_browser(browser: Browser) -> None:
+    """Close a browser, logging rather than raising if that fails"""
+    try:
+        await browser.close()
+    except Exception as e:
+        logger.warning("⚠️ Error closing pooled browser: %s", e)
+
+BROWSER_POOL = BrowserPool()
+
+def _is_blocked_host(url: str) -> bool:
+    """Check whether a URL's host is, or is a subdomain of, a blocked ad host"""
+    labels = (urlsplit(url).hostname or "").split(".")
+    return any(".".join(labels[i:]) in BLOCKED_HOSTS for i in range(len(labels) - 1))
+
+async def _block_unneeded_requests(route: Route) -> None:
+    """Abort requests for resources the scraper never reads"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def new_scraping_context(browser: Browser) -> BrowserContext:
+    """Open a browser context that skips images, fonts, media, styles and ad hosts"""
+    context = None
+    if os.path.exists(STORAGE_STATE_PATH):
+        try:
+            context = await browser.new_context(storage_state=STORAGE_STATE_PATH)
+        except Exception as e:
+            logger.warning("⚠️ Could not load saved Reddit session, starting fresh: %s", e)
+    if context is None:
+        context = await browser.new_context()
+    await context.route("**/*", _block_unneeded_requests)
+    return context
+
+def _write_storage_state(state: dict) -> None:
+    """Replace the saved session file atomically, so concurrent scrapes never read a partial one"""
+    with _STORAGE_STATE_LOCK:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, STORAGE_STATE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+async def save_storage_state(context: BrowserContext) -> None:
+    """Persist a context's Reddit cookies and local storage for later contexts"""
+    try:
+        state = await context.storage_state()
+        await asyncio.to_thread(_write_storage_state, state)
+    except Exception as e:
+        logger.warning("⚠️ Could not save Reddit session: %s", e)
+
+class BrowserLease:
+    """Acquires a pooled browser and scraping context for one scrape only when first needed"""
+
+    def __init__(self, pool: BrowserPool = BROWSER_POOL):
+        self._pool = pool
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+
+    async def get_browser(self) -> Browser:
+        """Get this scrape's browser, acquiring one from the pool on first use"""
+        if self._browser is None:
+            self._browser = await self._pool.acquire()
+        return self._browser
+
+    async def get_context(self) -> BrowserContext:
+        """Get this scrape's blocking context, opening it on first use"""
+        if self._context is None:
+            self._context = await new_scraping_context(await self.get_browser())
+        return self._context
+
+    async def close(self) -> None:
+        """Save and close the context, if any, and return the browser, if any, to the pool"""
+        if self._context is not None:
+            await save_storage_state(self._context)
+            try:
+                await self._context.close()
+            except Exception as e:
+                logger.warning("⚠️ Error closing browser context: %s", e)
+            self._context = None
+        if self._browser is not None:
+            await self._pool.release(self._browser)
+            self._browser = None
+
+async def wait_for_reddit_content(page: Page, timeout: int = READY_TIMEOUT_MS) -> bool:
+    """Wait until the page's Reddit listing or comment area exists"""
+    try:
+        await page.wait_for_selector(READY_SELECTOR, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        logger.warning("⚠️ Timed out waiting for Reddit content on %s", page.url)
+        return False
+
+async def extract_search_results_text(page: Page) -> str:
+    """Extract the text of old.reddit search results inside the browser"""
+    try:
+        results = await page.eval_on_selector_all("div.search-result", _SEARCH_RESULTS_JS)
+    except Exception as e:
+        logger.warning("❌ Error extracting search results: %s", e)
+        return ""
+    return "\n\n".join(result for result in results if result)
+
+async def _fetch_post_html_in_context(browser: Browser, url: str, semaphore: asyncio.Semaphore) -> Optional[str]:
+    """Load one Reddit post in its own browser context and return the rendered HTML"""
+    async with semaphore:
+        context = await new_scraping_context(browser)
+        try:
+            page = await context.new_page()
+            await page.goto(url, wait_until="domcontentloaded")
+            if not await wait_for_reddit_content(page):
+                return None
+            return await page.content()
+        except Exception as e:
+            logger.warning("❌ Error loading %s... in browser: %s", url[:60], e)
+            return None
+        finally:
+            await context.close()
+
+async def fetch_posts_html_with_browser(browser: Browser, urls: List[str]) -> List[Optional[str]]:
+    """Load several Reddit posts in parallel, isolated browser contexts, keeping the input order"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_POST_PAGES)
+    return await asyncio.gather(*(_fetch_post_html_in_context(browser, url, semaphore) for url in urls))
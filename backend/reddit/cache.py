@@ -0,0 +1,88 @@
+"""
+Persistent key-value cache for Reddit POI extraction
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+CACHE_PATH = os.path.join(CACHE_DIR, "reddit_cache.sqlite3")
+
+_CONN: Optional[sqlite3.Connection] = None
+_LOCK = threading.Lock()
+
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database on first use"""
+    global _CONN
+    if _CONN is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _CONN = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _CONN.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        # Rows are otherwise only skipped once expired, so clear out everything that expired since the last run
+        _CONN.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+        _CONN.commit()
+    return _CONN
+
+def make_cache_key(*parts: str) -> str:
+    """Hash the given parts into a stable cache key"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def cache_get(namespace: str, key: str) -> Optional[str]:
+    """Get a cached value, or None if it is missing or expired"""
+    now = time.time()
+    try:
+        with _LOCK:
+            conn = _get_connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+            if row is not None and row[1] is not None and row[1] < now:
+                conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ? AND expires_at < ?",
+                    (namespace, key, now)
+                )
+                conn.commit()
+                return None
+    except sqlite3.Error as e:
+        logger.warning("⚠️ Cache read failed: %s", e)
+        return None
+
+    return row[0] if row is not None else None
+
+def cache_set(namespace: str, key: str, value: str, ttl: Optional[float] = None) -> None:
+    """Store a value, expiring after ttl seconds (never if ttl is None)"""
+    expires_at = time.time() + ttl if ttl is not None else None
+    try:
+        with _LOCK:
+            conn = _get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, value, expires_at)
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("⚠️ Cache write failed: %s", e)
+
+async def acache_get(namespace: str, key: str) -> Optional[str]:
+    """cache_get in a worker thread, keeping sqlite I/O off the event loop"""
+    return await asyncio.to_thread(cache_get, namespace, key)
+
+async def acache_set(namespace: str, key: str, value: str, ttl: Optional[float] = None) -> None:
+    """cache_set in a worker thread, keeping the sqlite commit off the event loop"""
+    await asyncio.to_thread(cache_set, namespace, key, value, ttl)
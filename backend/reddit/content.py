@@ -0,0 +1,74 @@
+"""
+Content preprocessing utilities for Reddit POI extraction
+"""
+from functools import lru_cache
+import logging
+import re
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# Token budget for the POI extraction prompt (roughly the old 12000-char slice)
+MAX_EXTRACTION_TOKENS = 3000
+
+# Rough characters per token, for truncating when the tokenizer can't be loaded
+CHARS_PER_TOKEN = 4
+
+# Link and voting chrome old.reddit repeats under every post and comment; only runs of two or
+# more are chrome, since a lone "downvote" or "reply" is usually part of a comment, and runs never span lines
+_NAV_WORD = r'(?:permalink|embed|save|parent|report|give award|reply|share|hide|upvote|downvote)'
+_BOILERPLATE_RE = re.compile(rf'\b{_NAV_WORD}(?:[ \t]+{_NAV_WORD})+\b', re.IGNORECASE)
+# Whole lines of old.reddit chrome: score/age meta lines, comment-tree links and removed comments
+_CHROME_LINE_RE = re.compile(
+    r'^(?:\d+ points?\b.*'
+    r'|submitted \d+ (?:seconds?|minutes?|hours?|days?|months?|years?) ago\b.*'
+    r'|load more comments\b.*|continue this thread\b.*'
+    r'|\[(?:deleted|removed)\]'
+    rf'|{_NAV_WORD}(?:[ \t]+{_NAV_WORD})*)$',
+    re.IGNORECASE
+)
+
+# Shorter lines are section labels like "TOP COMMENTS:" that must repeat per post
+_MIN_DEDUP_LINE_LENGTH = 20
+
+_INLINE_WHITESPACE_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\s*\n\s*\n\s*')
+
+@lru_cache(maxsize=1)
+def get_encoding():
+    """Get the tokenizer used by gpt-4o-mini, or None if it can't be loaded"""
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # The BPE file is downloaded on first use, which fails on hosts without access to it;
+        # the None is cached so the download isn't retried on every call
+        logger.warning("⚠️ Tokenizer unavailable, truncating by characters instead: %s", e)
+        return None
+
+def truncate_to_tokens(text: str, max_tokens: int = MAX_EXTRACTION_TOKENS) -> str:
+    """Truncate text to at most max_tokens tokens, or roughly that many characters' worth without a tokenizer"""
+    encoding = get_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+def strip_reddit_boilerplate(text: str) -> str:
+    """Remove Reddit navigation text, chrome lines and repeated lines, and collapse whitespace"""
+    text = _BOILERPLATE_RE.sub(' ', text)
+    text = _INLINE_WHITESPACE_RE.sub(' ', text)
+    
+    seen = set()
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if _CHROME_LINE_RE.match(line):
+            continue
+        if len(line) >= _MIN_DEDUP_LINE_LENGTH:
+            if line in seen:
+                continue
+            seen.add(line)
+        lines.append(line)
+    return _BLANK_LINES_RE.sub('\n\n', '\n'.join(lines)).strip()
@@ -0,0 +1,128 @@
+"""
+Direct HTTP fetching of Reddit post pages
+"""
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+import httpx
+from bs4 import BeautifulSoup
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+from reddit.cache import acache_get, acache_set
+from reddit.http_client import get_http_client
+from reddit.search_terms import build_search_json_url
+
+logger = logging.getLogger(__name__)
+
+# Extracted text of Reddit post pages, refreshed every 6 hours
+POST_PAGE_CACHE = "post_page"
+POST_PAGE_CACHE_TTL = 6 * 60 * 60
+
+REDDIT_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; around-me-agent/1.0)"}
+
+# How many results to ask the subreddit JSON search endpoint for
+SEARCH_RESULT_LIMIT = 50
+
+# Attempts for a Reddit request that hits a rate limit, server error or dropped connection
+MAX_FETCH_ATTEMPTS = 3
+
+# How many top-level comments to keep from each post
+MAX_POST_COMMENTS = 10
+
+_TITLE_SELECTOR = "#siteTable a.title"
+_BODY_SELECTOR = "#siteTable div.usertext-body"
+_TOP_COMMENTS_SELECTOR = "div.commentarea > div.sitetable > div.comment > div.entry div.usertext-body"
+
+def _is_retryable(error: BaseException) -> bool:
+    """Retry rate limits, server errors and transport failures, but not other client errors"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    stop=stop_after_attempt(MAX_FETCH_ATTEMPTS),
+    wait=wait_exponential(multiplier=0.5, max=4),
+    reraise=True
+)
+async def _get_reddit(url: str, **kwargs) -> httpx.Response:
+    """GET a Reddit URL on the shared client, backing off and retrying transient failures"""
+    response = await get_http_client().get(url, headers=REDDIT_HEADERS, **kwargs)
+    response.raise_for_status()
+    return response
+
+def extract_post_text(html: str) -> str:
+    """Extract the title, body and top comments of an old.reddit post page"""
+    soup = BeautifulSoup(html, "lxml")
+    title = soup.select_one(_TITLE_SELECTOR)
+    if title is None:
+        root = soup.body or soup
+        for element in root(["script", "style", "noscript"]):
+            element.decompose()
+        return root.get_text(separator=" ", strip=True)
+
+    body = soup.select_one(_BODY_SELECTOR)
+    comments = soup.select(_TOP_COMMENTS_SELECTOR, limit=MAX_POST_COMMENTS)
+
+    parts = [f"TITLE: {title.get_text(strip=True)}"]
+    if body is not None:
+        parts.append(f"BODY: {body.get_text(separator=' ', strip=True)}")
+    if comments:
+        parts.append("TOP COMMENTS:")
+        parts.extend(f"- {comment.get_text(separator=' ', strip=True)}" for comment in comments)
+    return "\n".join(parts)
+
+async def fetch_search_results(subreddit: str, search_term: str) -> Optional[Tuple[str, List[str]]]:
+    """Search a subreddit via its JSON endpoint, returning the results' text and post URLs"""
+    try:
+        response = await _get_reddit(build_search_json_url(subreddit, search_term, SEARCH_RESULT_LIMIT))
+        children = response.json()["data"]["children"]
+    except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+        logger.warning("❌ Error searching r/%s via JSON: %s", subreddit, e)
+        return None
+
+    results = []
+    post_urls = []
+    for child in children:
+        post = child.get("data") or {}
+        permalink = post.get("permalink")
+        if not permalink:
+            continue
+        post_urls.append(f"https://old.reddit.com{permalink}".rstrip('/'))
+
+        parts = [post.get("title", "")]
+        parts.append(f"{post.get('num_comments', 0)} comments in r/{post.get('subreddit', subreddit)}")
+        if post.get("selftext"):
+            parts.append(post["selftext"])
+        results.append("\n".join(parts))
+    return "\n\n".join(results), post_urls
+
+async def fetch_post_text(url: str) -> Optional[str]:
+    """Fetch a Reddit post page over HTTP and return its text, using the page cache"""
+    cached = await acache_get(POST_PAGE_CACHE, url)
+    if cached is not None:
+        logger.debug("💾 Using cached content for %s...", url[:60])
+        return cached
+
+    try:
+        response = await _get_reddit(url)
+    except httpx.HTTPError as e:
+        logger.warning("❌ Error fetching %s...: %s", url[:60], e)
+        return None
+
+    text = extract_post_text(response.text)
+    if text:
+        await acache_set(POST_PAGE_CACHE, url, text, ttl=POST_PAGE_CACHE_TTL)
+    return text
+
+async def fetch_posts_text(urls: List[str]) -> List[Optional[str]]:
+    """Fetch several Reddit post pages concurrently, keeping the input order"""
+    results = await asyncio.gather(*(fetch_post_text(url) for url in urls), return_exceptions=True)
+    texts = []
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            logger.warning("❌ Error extracting %s...: %s", url[:60], result)
+            texts.append(None)
+        else:
+            texts.append(result)
+    return texts
@@ -1,21 +1,140 @@
 """
 Geocoding utilities for Reddit POI extraction
 """
+import asyncio
+import json
+import logging
 import os
+import orjson
 import requests
 import re
-from typing import Optional, Dict
+import unicodedata
+from collections import Counter, OrderedDict
+from contextvars import ContextVar
+from typing import Dict, List, Optional
 from utils.location import is_coordinates_in_city
-from langchain_core.messages import SystemMessage, HumanMessage
+from reddit.http_client import get_http_client
+from reddit.cache import acache_get, acache_set, cache_get, cache_set, make_cache_key
 from dotenv import load_dotenv
 load_dotenv(override=True)
 
+logger = logging.getLogger(__name__)
+
+# How many ranked candidate addresses to try geocoding before giving up
+MAX_CANDIDATE_ADDRESSES = 3
+
+# Geocoded POI coordinates are kept for 30 days on disk, and the most recent in memory
+GEOCODE_CACHE = "geocode"
+GEOCODE_CACHE_TTL = 30 * 24 * 60 * 60
+# Lookups every backend answered with "not found" are remembered for a day so repeat
+# misses don't re-query every backend; misses after an error or a missing API key aren't
+GEOCODE_MISS_CACHE_TTL = 24 * 60 * 60
+GEOCODE_MEMORY_SIZE = 4096
+_GEOCODE_MEMORY: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+# Backend errors seen by the lookup in progress, shared with the tasks it spawns
+_BACKEND_ERRORS: ContextVar[Optional[List[str]]] = ContextVar("backend_errors", default=None)
+
+# Serper searches in flight at once, across every POI being geocoded
+MAX_CONCURRENT_SERPER = 10
+
+# Decimal "lat, lng" pairs that sometimes appear in search titles and snippets
+_LATLNG_RE = re.compile(r"(-?\d{1,2}\.\d{3,}),\s*(-?\d{1,3}\.\d{3,})")
+
+# Seconds the search chain runs alone before a speculative OSM lookup starts; cached and
+# quick searches finish inside it, so they never take a slot in the Nominatim queue
+OSM_HEAD_START = 3.0
+
+# Raw Serper and Nominatim responses, reused for a week across runs
+SEARCH_RESPONSE_CACHE = "geocode_search"
+SEARCH_RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Nominatim's usage policy allows at most one request per second
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_HEADERS = {"User-Agent": "AroundMeAgent/1.0"}
+NOMINATIM_MIN_INTERVAL = 1.0
+
+# Street addresses like "123 Queen St" in search snippets and scraped pages
+_ADDRESS_RE = re.compile(
+    r"\d{1,5}\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:St|Street|Ave|Avenue|Rd|Road|Blvd|Boulevard|Dr|Drive|Lane|Ln|Way|Court|Ct|Crescent|Cres|Place|Pl|Terrace|Ter|Circle|Cir|Square|Sq|Parkway|Pkwy)",
+    re.IGNORECASE
+)
+
+class _BackendLimits:
+    """Throttles for the geocoding backends, bound to one event loop"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.serper = asyncio.Semaphore(MAX_CONCURRENT_SERPER)
+        self.nominatim = asyncio.Lock()
+        self.nominatim_last_request = float("-inf")
+
+_LIMITS: Optional[_BackendLimits] = None
+
+def _get_limits() -> _BackendLimits:
+    """Get the backend throttles, recreating them when used from a new event loop"""
+    global _LIMITS
+    loop = asyncio.get_running_loop()
+    if _LIMITS is None or _LIMITS.loop is not loop:
+        _LIMITS = _BackendLimits(loop)
+    return _LIMITS
+
+def _note_backend_error(reason: str) -> None:
+    """Record that a backend errored or was skipped, so the current lookup's miss isn't cached"""
+    errors = _BACKEND_ERRORS.get()
+    if errors is not None:
+        errors.append(reason)
+
+def _get_cached_response(service: str, query: str):
+    """Get a cached Serper or Nominatim response, or None on a miss"""
+    cached = cache_get(SEARCH_RESPONSE_CACHE, make_cache_key(service, query))
+    return orjson.loads(cached) if cached is not None else None
+
+def _cache_response(service: str, query: str, response) -> None:
+    """Store a Serper or Nominatim response for SEARCH_RESPONSE_CACHE_TTL"""
+    cache_set(SEARCH_RESPONSE_CACHE, make_cache_key(service, query), orjson.dumps(response).decode(), ttl=SEARCH_RESPONSE_CACHE_TTL)
+
+async def _aget_cached_response(service: str, query: str):
+    """_get_cached_response without blocking the event loop"""
+    cached = await acache_get(SEARCH_RESPONSE_CACHE, make_cache_key(service, query))
+    return orjson.loads(cached) if cached is not None else None
+
+async def _acache_response(service: str, query: str, response) -> None:
+    """_cache_response without blocking the event loop"""
+    await acache_set(SEARCH_RESPONSE_CACHE, make_cache_key(service, query), orjson.dumps(response).decode(), ttl=SEARCH_RESPONSE_CACHE_TTL)
+
+async def _search_nominatim(params: dict) -> list:
+    """Query Nominatim, spacing requests at least NOMINATIM_MIN_INTERVAL apart"""
+    query = json.dumps(params, sort_keys=True)
+    cached = await _aget_cached_response("nominatim", query)
+    if cached is not None:
+        return cached
+    
+    limits = _get_limits()
+    async with limits.nominatim:
+        delay = limits.nominatim_last_request + NOMINATIM_MIN_INTERVAL - limits.loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            response = await get_http_client().get(NOMINATIM_URL, params=params, headers=NOMINATIM_HEADERS)
+        finally:
+            limits.nominatim_last_request = limits.loop.time()
+    response.raise_for_status()
+    results = orjson.loads(response.content)
+    await _acache_response("nominatim", query, results)
+    return results
+
 def search_serper(query: str) -> dict:
     """Search using Serper.dev API"""
     serper_key = os.getenv("SERPER_API_KEY")
     if not serper_key:
-        print("⚠️ SERPER_API_KEY not found, using fallback coordinates")
+        logger.warning("⚠️ SERPER_API_KEY not found, using fallback coordinates")
+        _note_backend_error("SERPER_API_KEY not set")
         return {"organic": [], "knowledgeGraph": None}
+    
+    cached = _get_cached_response("serper", query)
+    if cached is not None:
+        return cached
         
     try:
         url = "https://google.serper.dev/search"
@@ -27,36 +146,208 @@ def search_serper(query: str) -> dict:
         
         response = requests.post(url, headers=headers, json=payload, timeout=10)
         response.raise_for_status()
-        return response.json()
+        results = orjson.loads(response.content)
+        _cache_response("serper", query, results)
+        return results
+    except Exception as e:
+        logger.warning("Serper search error: %s", e)
+        _note_backend_error(f"Serper: {e}")
+        return {"organic": [], "knowledgeGraph": None}
+
+async def search_serper_async(query: str) -> dict:
+    """Search using Serper.dev API over the shared async HTTP client"""
+    serper_key = os.getenv("SERPER_API_KEY")
+    if not serper_key:
+        logger.warning("⚠️ SERPER_API_KEY not found, using fallback coordinates")
+        _note_backend_error("SERPER_API_KEY not set")
+        return {"organic": [], "knowledgeGraph": None}
+    
+    cached = await _aget_cached_response("serper", query)
+    if cached is not None:
+        return cached
+        
+    try:
+        url = "https://google.serper.dev/search"
+        headers = {
+            "X-API-KEY": serper_key,
+            "Content-Type": "application/json"
+        }
+        payload = {"q": query}
+        
+        async with _get_limits().serper:
+            response = await get_http_client().post(url, headers=headers, json=payload)
+        response.raise_for_status()
+        results = orjson.loads(response.content)
+        await _acache_response("serper", query, results)
+        return results
     except Exception as e:
-        print(f"Serper search error: {e}")
+        logger.warning("Serper search error: %s", e)
+        _note_backend_error(f"Serper: {e}")
         return {"organic": [], "knowledgeGraph": None}
 
-def geocode_with_fallback(poi_name: str, city: str, province: str, country: str) -> Optional[Dict[str, float]]:
+async def _search_site_addresses(index: int, site_query: str) -> List[str]:
+    """Run one site-specific Serper search and collect addresses from its snippets and top page"""
+    logger.debug("  🔎 Site search %s: %s", index+1, site_query)
+    search_results = await search_serper_async(site_query)
+    
+    if not search_results.get("organic"):
+        logger.debug("⚠️ Site search %s returned no results", index+1)
+        return []
+    
+    logger.debug("✅ Site search %s returned %s results", index+1, len(search_results['organic']))
+    found_addresses = []
+    
+    for result in search_results["organic"][:2]:
+        snippet = result.get("snippet", "")
+        title = result.get("title", "")
+        
+        text = f"{title} {snippet}"
+        
+        for addr in _ADDRESS_RE.findall(text):
+            found_addresses.append(addr)
+            logger.debug("    📍 Found candidate address: %s", addr)
+    
+    try:
+        from bs4 import BeautifulSoup
+        
+        page_url = search_results["organic"][0]["link"]
+        logger.debug("    🌐 Scraping: %s", page_url)
+        
+        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        response = await get_http_client().get(page_url, headers=headers, timeout=5)
+        
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.text, 'html.parser')
+            page_text = soup.get_text()
+            
+            for addr in _ADDRESS_RE.findall(page_text)[:3]:
+                found_addresses.append(addr)
+                logger.debug("    📍 Found HTML address: %s", addr)
+                
+    except Exception as e:
+        logger.debug("    ⚠️ HTML scraping failed: %s", e)
+        _note_backend_error(f"HTML scraping: {e}")
+    
+    return found_addresses
+
+def _normalize_key_part(part: str) -> str:
+    """Fold Unicode variants, case and surrounding whitespace out of a cache key part"""
+    return unicodedata.normalize("NFKC", part).strip().casefold()
+
+def _coords_from_search_results(search_results: dict, city: str) -> Optional[Dict[str, float]]:
+    """Take coordinates written directly in search result titles or snippets, if any fall in the city"""
+    for result in search_results.get("organic", []):
+        text = f"{result.get('title', '')} {result.get('snippet', '')}"
+        for lat, lng in _LATLNG_RE.findall(text):
+            lat, lng = float(lat), float(lng)
+            if is_coordinates_in_city(lat, lng, city):
+                return {"lat": lat, "lng": lng}
+    return None
+
+def _geocode_cache_key(poi_name: str, city: str, province: str, country: str) -> str:
+    """Normalize a POI lookup into a cache key"""
+    return make_cache_key(*(_normalize_key_part(part) for part in (poi_name, city, province, country)))
+
+def _remember_geocode(cache_key: str, coords: Dict[str, float]) -> None:
+    """Keep coordinates in memory, evicting the least recently used beyond GEOCODE_MEMORY_SIZE"""
+    _GEOCODE_MEMORY[cache_key] = coords
+    _GEOCODE_MEMORY.move_to_end(cache_key)
+    if len(_GEOCODE_MEMORY) > GEOCODE_MEMORY_SIZE:
+        _GEOCODE_MEMORY.popitem(last=False)
+
+async def geocode_with_fallback(poi_name: str, city: str, province: str, country: str) -> Optional[Dict[str, float]]:
+    """Geocode a POI, reusing results from earlier lookups of the same name in the same city"""
+    cache_key = _geocode_cache_key(poi_name, city, province, country)
+    if cache_key in _GEOCODE_MEMORY:
+        logger.debug("💾 Using in-memory geocode for %s", poi_name)
+        _GEOCODE_MEMORY.move_to_end(cache_key)
+        return _GEOCODE_MEMORY[cache_key]
+    
+    cached = await acache_get(GEOCODE_CACHE, cache_key)
+    if cached is not None:
+        coords = json.loads(cached)
+        if coords is None:
+            logger.debug("💾 %s failed to geocode recently, skipping lookup", poi_name)
+            return None
+        logger.debug("💾 Using cached geocode for %s", poi_name)
+        _remember_geocode(cache_key, coords)
+        return coords
+    
+    errors: List[str] = []
+    token = _BACKEND_ERRORS.set(errors)
+    try:
+        coords = await _geocode_uncached(poi_name, city, province, country)
+    finally:
+        _BACKEND_ERRORS.reset(token)
+    
+    if coords:
+        _remember_geocode(cache_key, coords)
+        await acache_set(GEOCODE_CACHE, cache_key, json.dumps(coords), ttl=GEOCODE_CACHE_TTL)
+    elif errors:
+        logger.debug("⚠️ Not caching geocode miss for %s after backend errors: %s", poi_name, "; ".join(errors))
+    else:
+        await acache_set(GEOCODE_CACHE, cache_key, json.dumps(None), ttl=GEOCODE_MISS_CACHE_TTL)
+    return coords
+
+async def _geocode_uncached(poi_name: str, city: str, province: str, country: str) -> Optional[Dict[str, float]]:
     """Advanced geocoding: KnowledgeGraph → Site-specific Serper → HTML scraping → Google Places → OSM"""
-    print(f"🗺️ ===== STARTING GEOCODING FOR: {poi_name} =====")
-    print(f"📍 Target city: {city}, {province}, {country}")
+    logger.debug("🗺️ ===== STARTING GEOCODING FOR: %s =====", poi_name)
+    logger.debug("📍 Target city: %s, %s, %s", city, province, country)
+    
+    # OSM is the last resort: only query it alongside the search chain once that has run for a head start
+    search_task = asyncio.create_task(_geocode_with_search(poi_name, city, province, country))
+    osm_task = None
+    try:
+        done, _ = await asyncio.wait({search_task}, timeout=OSM_HEAD_START)
+        if not done:
+            osm_task = asyncio.create_task(_geocode_osm(poi_name, city, province, country))
+        coords = await search_task
+    except BaseException:
+        search_task.cancel()
+        if osm_task is not None:
+            osm_task.cancel()
+        raise
     
+    if coords:
+        if osm_task is not None:
+            osm_task.cancel()
+        return coords
+    
+    coords = await (osm_task if osm_task is not None else _geocode_osm(poi_name, city, province, country))
+    if coords:
+        return coords
+    
+    logger.warning("❌ ===== ALL GEOCODING METHODS FAILED FOR: %s =====", poi_name)
+    return None
+
+async def _geocode_with_search(poi_name: str, city: str, province: str, country: str) -> Optional[Dict[str, float]]:
+    """Geocode via KnowledgeGraph, site-specific Serper searches and Google Places"""
     try:
-        print(f"🔍 STEP 1: Checking Serper KnowledgeGraph for {poi_name}...")
+        logger.debug("🔍 STEP 1: Checking Serper KnowledgeGraph for %s...", poi_name)
         search_query = f'"{poi_name}" "{city}"'
-        search_results = search_serper(search_query)
+        search_results = await search_serper_async(search_query)
         
         if search_results.get("knowledgeGraph") and search_results["knowledgeGraph"].get("address"):
             address = search_results["knowledgeGraph"]["address"]
-            print(f"✅ KnowledgeGraph found address: {address}")
+            logger.debug("✅ KnowledgeGraph found address: %s", address)
             
-            coords = geocode_address(address, city, province, country)
+            coords = await geocode_address(address, city, province, country)
             if coords:
                 return coords
         else:
-            print("❌ No KnowledgeGraph address found")
+            logger.debug("❌ No KnowledgeGraph address found")
+        
+        coords = _coords_from_search_results(search_results, city)
+        if coords:
+            logger.debug("✅ Found coordinates in search snippets: (%s, %s)", coords["lat"], coords["lng"])
+            return coords
             
     except Exception as e:
-        print(f"❌ KnowledgeGraph search error: {e}")
+        logger.warning("❌ KnowledgeGraph search error: %s", e)
+        _note_backend_error(f"KnowledgeGraph search: {e}")
     
     try:
-        print(f"🔍 STEP 2: Using site-specific Serper searches...")
+        logger.debug("🔍 STEP 2: Using site-specific Serper searches...")
         site_queries = [
             f'"{poi_name}" "{city}" site:maps.google.com',
             f'"{poi_name}" "{city}" site:yellowpages.ca',
@@ -66,116 +357,41 @@ def geocode_with_fallback(poi_name: str, city: str, province: str, country: str)
             f'"{poi_name}" "{city}" site:opentable.ca'
         ]
         
-        candidate_addresses = []
+        site_addresses = await asyncio.gather(
+            *(_search_site_addresses(i, site_query) for i, site_query in enumerate(site_queries))
+        )
         
-        for i, site_query in enumerate(site_queries):
-            print(f"  🔎 Site search {i+1}: {site_query}")
-            search_results = search_serper(site_query)
-            
-            if search_results.get("organic") and len(search_results["organic"]) > 0:
-                print(f"✅ Site search {i+1} returned {len(search_results['organic'])} results")
-                
-                for result in search_results["organic"][:2]:
-                    snippet = result.get("snippet", "")
-                    title = result.get("title", "")
-                    link = result.get("link", "")
-                    
-                    text = f"{title} {snippet}"
-                    
-                    import re
-                    address_pattern = r"\d{1,5}\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:St|Street|Ave|Avenue|Rd|Road|Blvd|Boulevard|Dr|Drive|Lane|Ln|Way|Court|Ct|Crescent|Cres|Place|Pl|Terrace|Ter|Circle|Cir|Square|Sq|Parkway|Pkwy)"
-                    addresses = re.findall(address_pattern, text, re.IGNORECASE)
-                    
-                    for addr in addresses:
-                        if addr not in candidate_addresses:
-                            candidate_addresses.append(addr)
-                            print(f"    📍 Found candidate address: {addr}")
-                
-                if search_results["organic"]:
-                    try:
-                        import requests
-                        from bs4 import BeautifulSoup
-                        
-                        page_url = search_results["organic"][0]["link"]
-                        print(f"    🌐 Scraping: {page_url}")
-                        
-                        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-                        response = requests.get(page_url, headers=headers, timeout=5)
-                        
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            page_text = soup.get_text()
-                            
-                            html_addresses = re.findall(address_pattern, page_text, re.IGNORECASE)
-                            
-                            for addr in html_addresses[:3]:
-                                if addr not in candidate_addresses:
-                                    candidate_addresses.append(addr)
-                                    print(f"    📍 Found HTML address: {addr}")
-                                    
-                    except Exception as e:
-                        print(f"    ⚠️ HTML scraping failed: {e}")
-            else:
-                print(f"⚠️ Site search {i+1} returned no results")
+        candidate_addresses = []
+        address_counts = Counter()
+        for addresses in site_addresses:
+            for addr in addresses:
+                address_counts[addr] += 1
+                if addr not in candidate_addresses:
+                    candidate_addresses.append(addr)
         
         if candidate_addresses:
-            print(f"🔍 STEP 3: Ranking {len(candidate_addresses)} candidate addresses...")
+            logger.debug("🔍 STEP 3: Geocoding %s candidate addresses...", len(candidate_addresses))
             
-            from langchain_openai import ChatOpenAI
-            llm = ChatOpenAI(model="gpt-4o-mini")
+            # Addresses seen in more sources are more likely to be correct
+            ranked_addresses = sorted(candidate_addresses, key=lambda addr: -address_counts[addr])
             
-            ranking_prompt = f"""Rank these addresses by how likely they are to be the correct address for "{poi_name}" in {city}.
-
-Business: {poi_name}
-City: {city}, {province}, {country}
-
-Candidate addresses:
-{chr(10).join([f"{i+1}. {addr}" for i, addr in enumerate(candidate_addresses)])}
-
-Return ONLY the number of the best address, or "NONE" if none seem correct.
-
-Consider:
-- Addresses that include the business name are more likely correct
-- Addresses in {city} are more likely than other cities
-- More complete addresses (with street type) are better
-- Avoid generic addresses that could be anywhere
-
-Example: If address #3 seems best, return "3"
-Example: If none seem right, return "NONE"
-"""
-            
-            ranking_response = llm.invoke([
-                SystemMessage(content="You are an address ranking specialist. Return only a number (1, 2, 3, etc.) or 'NONE' if none seem correct."),
-                HumanMessage(content=ranking_prompt)
-            ])
+            for best_address in ranked_addresses[:MAX_CANDIDATE_ADDRESSES]:
+                logger.debug("    📍 Trying address (seen %sx): %s", address_counts[best_address], best_address)
+                coords = await geocode_address(best_address, city, province, country)
+                if coords:
+                    logger.debug("✅ Geocoded candidate address: %s", best_address)
+                    return coords
             
-            try:
-                response_text = ranking_response.content.strip()
-                print(f"    🤖 LLM response: '{response_text}'")
-                
-                if response_text.upper() == "NONE":
-                    print("❌ LLM said none of the addresses seem correct")
-                else:
-                    best_index = int(response_text) - 1
-                    if 0 <= best_index < len(candidate_addresses):
-                        best_address = candidate_addresses[best_index]
-                        print(f"✅ LLM selected best address: {best_address}")
-                        
-                        coords = geocode_address(best_address, city, province, country)
-                        if coords:
-                            return coords
-                    else:
-                        print(f"❌ LLM selected invalid address index: {best_index}")
-            except ValueError as e:
-                print(f"❌ LLM returned invalid response: '{ranking_response.content.strip()}' - {e}")
+            logger.debug("❌ None of the candidate addresses geocoded within city bounds")
         else:
-            print("❌ No candidate addresses found from site searches")
+            logger.debug("❌ No candidate addresses found from site searches")
             
     except Exception as e:
-        print(f"❌ Site-specific search error: {e}")
+        logger.warning("❌ Site-specific search error: %s", e)
+        _note_backend_error(f"Site-specific search: {e}")
     
     try:
-        print(f"🔍 STEP 4: Trying Google Places API with business name...")
+        logger.debug("🔍 STEP 4: Trying Google Places API with business name...")
         google_api_key = os.getenv("GOOGLE_PLACES_API_KEY")
         if google_api_key:
             search_strategies = [
@@ -186,7 +402,7 @@ Example: If none seem right, return "NONE"
             ]
             
             for i, search_input in enumerate(search_strategies):
-                print(f"  🔎 Google Places search {i+1}: {search_input}")
+                logger.debug("  🔎 Google Places search %s: %s", i+1, search_input)
                 
                 url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
                 params = {
@@ -196,11 +412,11 @@ Example: If none seem right, return "NONE"
                     "key": google_api_key
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = await get_http_client().get(url, params=params)
                 response.raise_for_status()
-                result = response.json()
+                result = orjson.loads(response.content)
                 
-                print(f"    📊 Google Places response status: {result.get('status')}")
+                logger.debug("    📊 Google Places response status: %s", result.get('status'))
                 
                 if result.get("status") == "OK" and result.get("candidates"):
                     candidate = result["candidates"][0]
@@ -212,11 +428,11 @@ Example: If none seem right, return "NONE"
                     place_types = candidate.get("types", [])
                     place_id = candidate.get("place_id", "N/A")
                     
-                    print(f"    📍 Google Places found: {place_name}")
-                    print(f"    📍 Address: {formatted_address}")
-                    print(f"    📍 Types: {place_types}")
-                    print(f"    📍 Place ID: {place_id}")
-                    print(f"    📍 Coordinates: ({lat}, {lng})")
+                    logger.debug("    📍 Google Places found: %s", place_name)
+                    logger.debug("    📍 Address: %s", formatted_address)
+                    logger.debug("    📍 Types: %s", place_types)
+                    logger.debug("    📍 Place ID: %s", place_id)
+                    logger.debug("    📍 Coordinates: (%s, %s)", lat, lng)
                     
                     is_likely_correct = (
                         poi_name.lower() in place_name.lower() or 
@@ -226,45 +442,49 @@ Example: If none seem right, return "NONE"
                     
                     if is_likely_correct:
                         if is_coordinates_in_city(lat, lng, city):
-                            print(f"✅ Google Places found correct business within city bounds: ({lat}, {lng})")
+                            logger.debug("✅ Google Places found correct business within city bounds: (%s, %s)", lat, lng)
                             return {"lat": lat, "lng": lng}
                         else:
-                            print(f"⚠️ Google Places found correct business but outside city bounds: ({lat}, {lng})")
-                            print(f"✅ Returning coordinates anyway since business name matches: ({lat}, {lng})")
+                            logger.debug("⚠️ Google Places found correct business but outside city bounds: (%s, %s)", lat, lng)
+                            logger.debug("✅ Returning coordinates anyway since business name matches: (%s, %s)", lat, lng)
                             return {"lat": lat, "lng": lng}
                     else:
-                        print(f"⚠️ Google Places found different business: {place_name}")
+                        logger.debug("⚠️ Google Places found different business: %s", place_name)
                         continue
                 else:
-                    print(f"❌ Google Places search {i+1} failed: {result.get('status')} - {result.get('error_message', 'No error message')}")
+                    logger.debug("❌ Google Places search %s failed: %s - %s", i+1, result.get('status'), result.get('error_message', 'No error message'))
+                    if result.get("status") != "ZERO_RESULTS":
+                        _note_backend_error(f"Google Places status {result.get('status')}")
                     continue
             
-            print("❌ All Google Places search strategies failed")
+            logger.debug("❌ All Google Places search strategies failed")
         else:
-            print("⚠️ GOOGLE_PLACES_API_KEY not found, skipping Google Places")
+            logger.warning("⚠️ GOOGLE_PLACES_API_KEY not found, skipping Google Places")
+            _note_backend_error("GOOGLE_PLACES_API_KEY not set")
             
     except Exception as e:
-        print(f"❌ Google Places geocoding error: {e}")
+        logger.warning("❌ Google Places geocoding error: %s", e)
+        _note_backend_error(f"Google Places: {e}")
     
+    return None
+
+async def _geocode_osm(poi_name: str, city: str, province: str, country: str) -> Optional[Dict[str, float]]:
+    """Geocode a POI by name with OpenStreetMap (Nominatim)"""
     try:
-        print(f"🔍 STEP 5: Trying OpenStreetMap (Nominatim)...")
+        logger.debug("🔍 STEP 5: Trying OpenStreetMap (Nominatim)...")
         search_query = f"{poi_name}, {city}, {province}, {country}"
-        print(f"  🔎 OpenStreetMap search: {search_query}")
+        logger.debug("  🔎 OpenStreetMap search: %s", search_query)
         
-        url = "https://nominatim.openstreetmap.org/search"
         params = {
             "q": search_query,
             "format": "json",
             "limit": 3,
             "addressdetails": 1
         }
-        headers = {"User-Agent": "AroundMeAgent/1.0"}
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        results = response.json()
+        results = await _search_nominatim(params)
         
-        print(f"    📊 OpenStreetMap returned {len(results)} results")
+        logger.debug("    📊 OpenStreetMap returned %s results", len(results))
         
         if results and len(results) > 0:
             for i, result in enumerate(results):
@@ -273,29 +493,29 @@ Example: If none seem right, return "NONE"
                 display_name = result.get("display_name", "N/A")
                 result_type = result.get("type", "N/A")
                 
-                print(f"    📍 Result {i+1}: {display_name}")
-                print(f"    📍 Type: {result_type}")
-                print(f"    📍 Coordinates: ({lat}, {lon})")
+                logger.debug("    📍 Result %s: %s", i+1, display_name)
+                logger.debug("    📍 Type: %s", result_type)
+                logger.debug("    📍 Coordinates: (%s, %s)", lat, lon)
                 
                 if is_coordinates_in_city(lat, lon, city):
-                    print(f"✅ OpenStreetMap result {i+1} within city bounds: ({lat}, {lon})")
+                    logger.debug("✅ OpenStreetMap result %s within city bounds: (%s, %s)", i+1, lat, lon)
                     return {"lat": lat, "lng": lon}
                 else:
-                    print(f"⚠️ OpenStreetMap result {i+1} outside city bounds: ({lat}, {lon})")
+                    logger.debug("⚠️ OpenStreetMap result %s outside city bounds: (%s, %s)", i+1, lat, lon)
             
-            print("❌ All OpenStreetMap results were outside city bounds")
+            logger.debug("❌ All OpenStreetMap results were outside city bounds")
         else:
-            print("❌ OpenStreetMap returned no results")
+            logger.debug("❌ OpenStreetMap returned no results")
             
     except Exception as e:
-        print(f"❌ OpenStreetMap geocoding error: {e}")
+        logger.warning("❌ OpenStreetMap geocoding error: %s", e)
+        _note_backend_error(f"OpenStreetMap: {e}")
     
-    print(f"❌ ===== ALL GEOCODING METHODS FAILED FOR: {poi_name} =====")
     return None
 
-def geocode_address(address: str, city: str, province: str, country: str) -> Optional[Dict[str, float]]:
+async def geocode_address(address: str, city: str, province: str, country: str) -> Optional[Dict[str, float]]:
     """Helper function to geocode a specific address"""
-    print(f"    🗺️ Geocoding address: {address}")
+    logger.debug("    🗺️ Geocoding address: %s", address)
     
     try:
         google_api_key = os.getenv("GOOGLE_PLACES_API_KEY")
@@ -310,9 +530,9 @@ def geocode_address(address: str, city: str, province: str, country: str) -> Opt
                 "key": google_api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = await get_http_client().get(url, params=params)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             
             if result.get("status") == "OK" and result.get("candidates"):
                 location = result["candidates"][0]["geometry"]["location"]
@@ -320,28 +540,29 @@ def geocode_address(address: str, city: str, province: str, country: str) -> Opt
                 lng = location["lng"]
                 
                 if is_coordinates_in_city(lat, lng, city):
-                    print(f"    ✅ Google Places geocoded: ({lat}, {lng})")
+                    logger.debug("    ✅ Google Places geocoded: (%s, %s)", lat, lng)
                     return {"lat": lat, "lng": lng}
                 else:
-                    print(f"    ⚠️ Google Places coordinates outside city bounds: ({lat}, {lng})")
+                    logger.debug("    ⚠️ Google Places coordinates outside city bounds: (%s, %s)", lat, lng)
+            elif result.get("status") != "ZERO_RESULTS":
+                _note_backend_error(f"Google Places status {result.get('status')}")
+        else:
+            _note_backend_error("GOOGLE_PLACES_API_KEY not set")
     except Exception as e:
-        print(f"    ❌ Google Places geocoding error: {e}")
+        logger.warning("    ❌ Google Places geocoding error: %s", e)
+        _note_backend_error(f"Google Places: {e}")
     
     try:
         search_query = f"{address}, {city}, {province}, {country}"
         
-        url = "https://nominatim.openstreetmap.org/search"
         params = {
             "q": search_query,
             "format": "json",
             "limit": 1,
             "addressdetails": 1
         }
-        headers = {"User-Agent": "AroundMeAgent/1.0"}
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        results = response.json()
+        results = await _search_nominatim(params)
         
         if results and len(results) > 0:
             result = results[0]
@@ -349,11 +570,12 @@ def geocode_address(address: str, city: str, province: str, country: str) -> Opt
             lon = float(result["lon"])
             
             if is_coordinates_in_city(lat, lon, city):
-                print(f"    ✅ OpenStreetMap geocoded: ({lat}, {lon})")
+                logger.debug("    ✅ OpenStreetMap geocoded: (%s, %s)", lat, lon)
                 return {"lat": lat, "lng": lon}
             else:
-                print(f"    ⚠️ OpenStreetMap coordinates outside city bounds: ({lat}, {lon})")
+                logger.debug("    ⚠️ OpenStreetMap coordinates outside city bounds: (%s, %s)", lat, lon)
     except Exception as e:
-        print(f"    ❌ OpenStreetMap geocoding error: {e}")
+        logger.warning("    ❌ OpenStreetMap geocoding error: %s", e)
+        _note_backend_error(f"OpenStreetMap: {e}")
     
     return None
@@ -0,0 +1,32 @@
+"""
+Shared HTTP client for Reddit POI extraction
+"""
+import asyncio
+import httpx
+from typing import Optional
+
+_HTTP: Optional[httpx.AsyncClient] = None
+_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use in the running loop"""
+    global _HTTP, _HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP is None or _HTTP.is_closed or _HTTP_LOOP is not loop:
+        # HTTP/2 multiplexes concurrent Serper and Reddit requests over one connection per host
+        _HTTP = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=10.0,
+            follow_redirects=True
+        )
+        _HTTP_LOOP = loop
+    return _HTTP
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections"""
+    global _HTTP, _HTTP_LOOP
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
+        _HTTP_LOOP = None
@@ -2,13 +2,14 @@
 Pydantic models for Reddit POI extraction
 """
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 class POI(BaseModel):
     name: str = Field(description="Name of the point of interest")
     description: str = Field(description="Brief description of what makes this place special")
     category: str = Field(description="Category like 'museum', 'park', 'restaurant', 'attraction'")
     reddit_context: str = Field(description="Original Reddit content mentioning this place for authentic summary generation")
+    inline_address: Optional[str] = Field(default=None, description="Street address or intersection for this place if the Reddit content states one, otherwise null")
 
 class POIList(BaseModel):
     city: str = Field(description="The city being analyzed")
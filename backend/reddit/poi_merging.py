@@ -0,0 +1,28 @@
+"""
+Duplicate POI detection and merging
+"""
+import re
+from typing import Dict, List
+from reddit.models import POI
+
+# Ignored when comparing POI names: a leading "the", punctuation and spacing
+_LEADING_THE_RE = re.compile(r'^the\s+')
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+def poi_name_key(name: str) -> str:
+    """Normalize a POI name so spelling variants like "The CN Tower" and "cn-tower" compare equal"""
+    key = _LEADING_THE_RE.sub('', name.strip().lower())
+    return _NON_WORD_RE.sub('', key) or name.strip().lower()
+
+def merge_duplicate_pois(pois: List[POI]) -> List[POI]:
+    """Merge POIs that share a normalized name, joining their Reddit context"""
+    merged: Dict[str, POI] = {}
+    for poi in pois:
+        key = poi_name_key(poi.name)
+        if key in merged:
+            existing = merged[key]
+            existing.reddit_context = f"{existing.reddit_context}\n---\n{poi.reddit_context}"
+            existing.inline_address = existing.inline_address or poi.inline_address
+        else:
+            merged[key] = poi.model_copy()
+    return list(merged.values())
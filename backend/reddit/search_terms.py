@@ -2,27 +2,42 @@
 Search terms for Reddit scraping
 """
 import random
+from urllib.parse import quote, urlencode
+
+# Phrases combined with the city name to form search queries, encoded only when a URL is built
+SEARCH_TERM_PREFIXES = (
+    "cool places",
+    "fun things to do",
+    "best places",
+    "hidden gems",
+    "underrated places",
+    "unique places",
+    "interesting spots",
+    "local favorites",
+    "must see",
+    "favorite spots",
+    "amazing places",
+    "cool spots",
+)
 
 def get_search_terms(city: str) -> list:
     """Get optimized search terms for Reddit scraping"""
-    search_terms = [
-        f"cool%20places%20{city.lower()}",
-        f"fun%20things%20to%20do%20{city.lower()}",
-        f"best%20places%20{city.lower()}",
-        f"hidden%20gems%20{city.lower()}",
-        f"underrated%20places%20{city.lower()}",
-        f"unique%20places%20{city.lower()}",
-        f"interesting%20spots%20{city.lower()}",
-        f"local%20favorites%20{city.lower()}",
-        f"must%20see%20{city.lower()}",
-        f"favorite%20spots%20{city.lower()}",
-        f"amazing%20places%20{city.lower()}",
-        f"cool%20spots%20{city.lower()}"
-    ]
-    
-    return search_terms
+    city_term = city.lower()
+    return [f"{prefix} {city_term}" for prefix in SEARCH_TERM_PREFIXES]
 
 def get_random_search_term(city: str) -> str:
     """Get a random search term for the given city"""
-    search_terms = get_search_terms(city)
-    return random.choice(search_terms)
+    return f"{random.choice(SEARCH_TERM_PREFIXES)} {city.lower()}"
+
+def _search_query(search_term: str, **extra_params) -> str:
+    """Encode a subreddit search for search_term, sorted by relevance over all time"""
+    params = {"q": search_term, "restrict_sr": "on", "sort": "relevance", "t": "all", **extra_params}
+    return urlencode(params, quote_via=quote)
+
+def build_search_url(subreddit: str, search_term: str) -> str:
+    """Build the old.reddit search URL for a subreddit, sorted by relevance"""
+    return f"https://old.reddit.com/r/{subreddit}/search/?{_search_query(search_term)}"
+
+def build_search_json_url(subreddit: str, search_term: str, limit: int) -> str:
+    """Build the old.reddit JSON search URL for a subreddit, returning up to limit results"""
+    return f"https://old.reddit.com/r/{subreddit}/search.json?{_search_query(search_term, limit=limit)}"
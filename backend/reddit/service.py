@@ -1,36 +1,32 @@
 from agents.reddit_scraper import get_reddit_pois_direct
+import logging
 import random
 import time
 
+logger = logging.getLogger(__name__)
+
 async def get_reddit_pois(city: str, province: str, country: str, user_lat: float, user_lon: float) -> list:
     """Get Reddit POIs for a location"""
-    print(f"Starting direct Reddit scraper for coordinates: {user_lat}, {user_lon} in {city}, {province}, {country}")
-    
+    logger.info("Starting direct Reddit scraper for coordinates: %s, %s in %s, %s, %s", user_lat, user_lon, city, province, country)
+
     timestamp = int(time.time())
-    print(f"=== USING DIRECT REDDIT SCRAPER ===")
-    print(f"City: {city}")
-    print(f"Province: {province}")
-    print(f"Country: {country}")
-    print(f"Timestamp: {timestamp}")
-    print("=" * 50)
-    
+    logger.debug("=== USING DIRECT REDDIT SCRAPER === city=%s province=%s country=%s timestamp=%s", city, province, country, timestamp)
+
     try:
         reddit_pois = await get_reddit_pois_direct(city, province, country, user_lat, user_lon)
-        
+
         if reddit_pois:
-            print(f"=== FOUND {len(reddit_pois)} REDDIT POIs ===")
-            for i, poi in enumerate(reddit_pois, 1):
-                print(f"Reddit POI {i}: {poi['name']} at {poi['lat']}, {poi['lng']}")
-                print(f"Summary: {poi['summary'][:100]}...")
-                print(f"Type: {poi['type']}")
-                print("-" * 30)
+            logger.info("=== FOUND %s REDDIT POIs ===", len(reddit_pois))
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, poi in enumerate(reddit_pois, 1):
+                    logger.debug("Reddit POI %s: %s at %s, %s", i, poi['name'], poi['lat'], poi['lng'])
+                    logger.debug("Summary: %s...", poi['summary'][:100])
+                    logger.debug("Type: %s", poi['type'])
         else:
-            print("No Reddit POIs found")
-            
+            logger.info("No Reddit POIs found")
+
         return reddit_pois
-        
+
     except Exception as e:
-        print(f"Reddit scraper error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Reddit scraper error: %s", e)
         return []
@@ -1,52 +1,57 @@
 """
 Reddit URL extraction utilities
 """
+import io
+import logging
 import re
-from typing import List
-from bs4 import BeautifulSoup
+from typing import List, Optional
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+_ABSOLUTE_URL_PREFIXES = ('http://', 'https://')
+
+# Absolute or site-relative Reddit post URLs, matched in a single pass
+_POST_URL_RE = re.compile(r'(?:https://(?:old\.|www\.)?reddit\.com)?/r/\w+/comments/\w+/[\w\-]+/?')
+
+# Captures the subreddit of an absolute Reddit post URL
+_POST_SUBREDDIT_RE = re.compile(r'^https?://(?:old\.|www\.)?reddit\.com/r/([^/]+)/comments/')
+
+# Slug fragments that suggest a post recommends places to visit
+_RELEVANT_SLUG_WORDS = (
+    "things", "todo", "to_do", "best", "recommend", "hidden", "gem", "fun", "cool",
+    "favorite", "favourite", "spot", "place", "visit", "explore", "view", "underrated"
+)
+
+def _normalize_reddit_url(href: str) -> str:
+    """Make a Reddit href absolute and strip its query string and trailing slash"""
+    if not href.startswith(_ABSOLUTE_URL_PREFIXES):
+        href = f"https://old.reddit.com{href}"
+    return href.partition('?')[0].rstrip('/')
+
+def get_post_subreddit(url: str) -> Optional[str]:
+    """Get the subreddit a Reddit post URL belongs to, or None if it isn't a post URL"""
+    match = _POST_SUBREDDIT_RE.match(url)
+    return match.group(1) if match else None
 
 def extract_reddit_post_urls_from_text(text_content: str, target_subreddit: str = None) -> List[str]:
     """Extract Reddit post URLs from plain text content using regex patterns"""
     try:
         post_urls = []
         
-        url_patterns = [
-            r'https://old\.reddit\.com/r/\w+/comments/[\w]+/[\w\-\_]+/?',
-            r'https://reddit\.com/r/\w+/comments/[\w]+/[\w\-\_]+/?',
-            r'https://www\.reddit\.com/r/\w+/comments/[\w]+/[\w\-\_]+/?',
-            r'/r/\w+/comments/[\w]+/[\w\-\_]+/?',
-            r'comments/([\w]+)/[\w\-\_]+',
-        ]
-        
-        for pattern in url_patterns:
-            matches = re.findall(pattern, text_content)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0] if match else ""
-                
-                if match:
-                    if match.startswith('/r/'):
-                        full_url = f"https://old.reddit.com{match}"
-                    elif match.startswith('http'):
-                        full_url = match
-                    elif 'comments/' in match:
-                        continue
-                    else:
-                        full_url = f"https://old.reddit.com{match}"
-                    
-                    full_url = full_url.split('?')[0]
-                    full_url = full_url.rstrip('/')
-                    
-                    if target_subreddit:
-                        if f"/r/{target_subreddit}/comments/" in full_url and full_url not in post_urls:
-                            post_urls.append(full_url)
-                    elif full_url not in post_urls and '/comments/' in full_url:
-                        post_urls.append(full_url)
+        for match in _POST_URL_RE.findall(text_content):
+            full_url = _normalize_reddit_url(match)
+            
+            if target_subreddit:
+                if f"/r/{target_subreddit}/comments/" in full_url and full_url not in post_urls:
+                    post_urls.append(full_url)
+            elif full_url not in post_urls:
+                post_urls.append(full_url)
         
         return list(set(post_urls))
         
     except Exception as e:
-        print(f"Error extracting Reddit URLs from text: {e}")
+        logger.warning("Error extracting Reddit URLs from text: %s", e)
         return []
 
 async def extract_reddit_post_urls_from_playwright(page, target_subreddit: str = None) -> List[str]:
@@ -54,86 +59,66 @@ async def extract_reddit_post_urls_from_playwright(page, target_subreddit: str =
     try:
         post_urls = []
         
-        comment_links = await page.query_selector_all("a[href*='/comments/']")
+        hrefs = await page.eval_on_selector_all(
+            "a[href*='/comments/']",
+            "links => links.map(link => link.getAttribute('href'))"
+        )
         
-        for link in comment_links:
-            try:
-                href = await link.get_attribute('href')
-                if href and 'reddit.com' in href:
-                    if href.startswith('/'):
-                        full_url = f"https://old.reddit.com{href}"
-                    elif href.startswith('http'):
-                        full_url = href
-                    else:
-                        full_url = f"https://old.reddit.com{href}"
-                    
-                    full_url = full_url.split('?')[0].rstrip('/')
-                    
-                    if target_subreddit:
-                        if f"/r/{target_subreddit}/comments/" in full_url:
-                            if full_url not in post_urls:
-                                post_urls.append(full_url)
-                    else:
+        for href in hrefs:
+            if href and 'reddit.com' in href:
+                full_url = _normalize_reddit_url(href)
+                
+                if target_subreddit:
+                    if f"/r/{target_subreddit}/comments/" in full_url:
                         if full_url not in post_urls:
                             post_urls.append(full_url)
-            except Exception as e:
-                continue
+                else:
+                    if full_url not in post_urls:
+                        post_urls.append(full_url)
         
-        return list(set(post_urls))
+        return post_urls
         
     except Exception as e:
-        print(f"Error extracting URLs with Playwright: {e}")
+        logger.warning("Error extracting URLs with Playwright: %s", e)
         return []
 
 def extract_reddit_post_urls(html_content: str) -> List[str]:
-    """Extract Reddit post URLs from HTML content using BeautifulSoup"""
+    """Extract Reddit post URLs from HTML content by streaming its anchors with lxml"""
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
         post_urls = []
         
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            href = link.get('href', '')
-            if '/comments/' in href and 'reddit.com' in href:
-                if href.startswith('/'):
-                    full_url = f"https://old.reddit.com{href}"
-                elif href.startswith('http'):
-                    full_url = href
-                else:
-                    full_url = f"https://old.reddit.com{href}"
-                
-                full_url = full_url.split('?')[0]
-                full_url = full_url.rstrip('/')
+        try:
+            for _, link in etree.iterparse(io.BytesIO(html_content.encode()), tag='a', html=True, recover=True):
+                href = link.get('href', '')
+                if '/comments/' in href and 'reddit.com' in href:
+                    full_url = _normalize_reddit_url(href)
+                    
+                    if full_url not in post_urls:
+                        post_urls.append(full_url)
                 
-                if full_url not in post_urls:
-                    post_urls.append(full_url)
+                # Drop parsed anchors so memory stays proportional to one link
+                link.clear()
+                while link.getprevious() is not None:
+                    del link.getparent()[0]
+        except etree.LxmlError as e:
+            logger.warning("Error streaming anchors from HTML: %s", e)
         
-        url_patterns = [
-            r'https://old\.reddit\.com/r/\w+/comments/[\w]+/[\w\-\_]+/?',
-            r'https://reddit\.com/r/\w+/comments/[\w]+/[\w\-\_]+/?',
-            r'/r/\w+/comments/[\w]+/[\w\-\_]+/?',
-            r'href="(/r/\w+/comments/[\w]+/[\w\-\_]+/?)"',
-            r'href="(https://old\.reddit\.com/r/\w+/comments/[\w]+/[\w\-\_]+/?)"',
-            r'href="(https://reddit\.com/r/\w+/comments/[\w]+/[\w\-\_]+/?)"',
-        ]
-        
-        for pattern in url_patterns:
-            matches = re.findall(pattern, html_content)
-            for match in matches:
-                if match.startswith('/r/'):
-                    full_url = f"https://old.reddit.com{match}"
-                elif match.startswith('http'):
-                    full_url = match
-                else:
-                    full_url = f"https://old.reddit.com{match}"
-                
-                full_url = full_url.split('?')[0].rstrip('/')
-                if full_url not in post_urls:
-                    post_urls.append(full_url)
+        for match in _POST_URL_RE.findall(html_content):
+            full_url = _normalize_reddit_url(match)
+            if full_url not in post_urls:
+                post_urls.append(full_url)
         
         return list(set(post_urls))
         
     except Exception as e:
-        print(f"Error extracting Reddit URLs: {e}")
+        logger.warning("Error extracting Reddit URLs: %s", e)
         return []
+
+def _slug_relevance(url: str) -> int:
+    """Count how many relevance words appear in a post URL's slug"""
+    slug = url.rstrip('/').rsplit('/', 1)[-1].lower()
+    return sum(word in slug for word in _RELEVANT_SLUG_WORDS)
+
+def select_relevant_post_urls(urls: List[str], limit: int = 5) -> List[str]:
+    """Pick the posts whose slugs look most like place recommendations, keeping page order on ties"""
+    return sorted(urls, key=_slug_relevance, reverse=True)[:limit]
@@ -1,6 +1,23 @@
+import logging
+import logging.handlers
+import os
+import queue
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routes import locations
+from reddit.http_client import close_http_client
+from reddit.browser import BROWSER_POOL
+
+# Handlers write from a background thread so logging never blocks the event loop
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener.start()
 
 app = FastAPI()
 
@@ -11,6 +28,12 @@ app.add_middleware(
 
 app.include_router(locations.router, prefix="/api")
 
+@app.on_event("shutdown")
+async def shutdown():
+    await close_http_client()
+    await BROWSER_POOL.close()
+    _log_listener.stop()
+
 @app.get("/")
 def read_root():
     return {"message": "AroundMe Agent API"}
\ No newline at end of file
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Offline tests for BrowserPool acquire/release bookkeeping
+"""
+import asyncio
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reddit.browser import BrowserPool
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.connected = False
+
+def _fake_pool(monkeypatch, max_size):
+    pool = BrowserPool(max_size=max_size)
+    launched = []
+
+    async def fake_launch():
+        browser = FakeBrowser()
+        launched.append(browser)
+        return browser
+
+    monkeypatch.setattr(pool, "_launch", fake_launch)
+    return pool, launched
+
+def test_released_browser_is_reused(monkeypatch):
+    """A released browser is handed out again instead of launching another"""
+    pool, launched = _fake_pool(monkeypatch, max_size=2)
+
+    async def run():
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+        assert second is first
+        assert pool._launched == 1
+
+    asyncio.run(run())
+    assert len(launched) == 1
+
+def test_acquire_waits_when_pool_is_full(monkeypatch):
+    """Acquiring beyond max_size waits for a release rather than launching"""
+    pool, launched = _fake_pool(monkeypatch, max_size=1)
+
+    async def run():
+        first = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await pool.release(first)
+        assert await asyncio.wait_for(waiter, timeout=1) is first
+        assert pool._launched == 1
+
+    asyncio.run(run())
+    assert len(launched) == 1
+
+def test_disconnected_browser_frees_its_slot(monkeypatch):
+    """Releasing a dead browser lets the pool launch a replacement"""
+    pool, launched = _fake_pool(monkeypatch, max_size=1)
+
+    async def run():
+        first = await pool.acquire()
+        first.connected = False
+        await pool.release(first)
+        assert pool._launched == 0
+        second = await pool.acquire()
+        assert second is not first
+        assert pool._launched == 1
+
+    asyncio.run(run())
+    assert len(launched) == 2
+
+def test_close_closes_idle_browsers(monkeypatch):
+    """Closing the pool closes idle browsers and resets the launch count"""
+    pool, launched = _fake_pool(monkeypatch, max_size=2)
+
+    async def run():
+        browsers = [await pool.acquire(), await pool.acquire()]
+        for browser in browsers:
+            await pool.release(browser)
+        await pool.close()
+        assert pool._launched == 0
+
+    asyncio.run(run())
+    assert not any(browser.connected for browser in launched)
+
+def test_close_closes_leased_browsers(monkeypatch):
+    """Browsers leased out when the pool closes are closed too"""
+    pool, launched = _fake_pool(monkeypatch, max_size=2)
+
+    async def run():
+        leased = await pool.acquire()
+        idle = await pool.acquire()
+        await pool.release(idle)
+        await pool.close()
+        assert not leased.connected and not idle.connected
+
+    asyncio.run(run())
+
+def test_release_after_close_closes_browser(monkeypatch):
+    """A browser returned after close is closed instead of going back into the pool"""
+    pool, launched = _fake_pool(monkeypatch, max_size=1)
+
+    async def run():
+        leased = await pool.acquire()
+        await pool.close()
+        leased.connected = True  # as if closing it had failed
+        await pool.release(leased)
+        assert not leased.connected
+        assert pool._idle.empty()
+        replacement = await pool.acquire()
+        assert replacement is not leased
+
+    asyncio.run(run())
+    assert len(launched) == 2
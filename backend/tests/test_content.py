@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Offline tests for Reddit content cleanup before POI extraction
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reddit import content
+from reddit.content import strip_reddit_boilerplate, truncate_to_tokens
+
+def test_nav_words_do_not_merge_across_lines():
+    """A nav-word run at the end of one comment must not swallow the start of the next"""
+    text = "Try the Lakeview Diner by the post office. Give award\nHide and seek at the Reply Bar"
+    assert strip_reddit_boilerplate(text) == text
+
+def test_nav_word_runs_within_a_line_are_removed():
+    """Runs of link chrome inside a line are dropped"""
+    text = "Go to Kensington Market permalink embed save parent report for tacos"
+    assert strip_reddit_boilerplate(text) == "Go to Kensington Market for tacos"
+
+def test_lone_nav_words_inside_comments_are_kept():
+    """Nav vocabulary in a comment's own words is not chrome"""
+    text = "Don't downvote me but Casa Loma is overrated, reply if you disagree"
+    assert strip_reddit_boilerplate(text) == text
+
+def test_nav_only_lines_are_dropped():
+    """A line holding only link chrome is dropped, even a single word"""
+    text = "Check out the Evergreen Brick Works\npermalink\nGive award\nThe farmers market is great"
+    assert strip_reddit_boilerplate(text) == (
+        "Check out the Evergreen Brick Works\nThe farmers market is great"
+    )
+
+def test_chrome_lines_are_dropped():
+    """Score, submission-age, comment-tree and removed-comment lines are dropped"""
+    text = "\n".join([
+        "TITLE: Hidden gems downtown",
+        "12 points 3 hours ago",
+        "submitted 2 years ago by someone to r/toronto",
+        "load more comments (4 replies)",
+        "[deleted]",
+        "- The Distillery District at Christmas",
+    ])
+    assert strip_reddit_boilerplate(text) == (
+        "TITLE: Hidden gems downtown\n- The Distillery District at Christmas"
+    )
+
+def test_repeated_lines_are_dropped_but_section_labels_kept():
+    """Repeated comment text is sent once, while short labels repeat per post"""
+    text = "\n".join([
+        "TOP COMMENTS:",
+        "- Allan Gardens has a great conservatory",
+        "TOP COMMENTS:",
+        "- Allan Gardens has a great conservatory",
+    ])
+    assert strip_reddit_boilerplate(text) == (
+        "TOP COMMENTS:\n- Allan Gardens has a great conservatory\nTOP COMMENTS:"
+    )
+
+def test_truncation_falls_back_to_characters_without_tokenizer(monkeypatch, caplog):
+    """An unavailable tokenizer truncates by characters, and loading it is tried and logged only once"""
+    calls = []
+
+    def unavailable(name):
+        calls.append(name)
+        raise OSError("could not download o200k_base")
+
+    monkeypatch.setattr(content.tiktoken, "get_encoding", unavailable, raising=False)
+    content.get_encoding.cache_clear()
+    try:
+        assert truncate_to_tokens("x" * 100, max_tokens=5) == "x" * (5 * content.CHARS_PER_TOKEN)
+        assert truncate_to_tokens("y" * 100, max_tokens=5) == "y" * (5 * content.CHARS_PER_TOKEN)
+    finally:
+        content.get_encoding.cache_clear()
+    assert len(calls) == 1
+    assert sum("Tokenizer unavailable" in record.message for record in caplog.records) == 1
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Offline tests for caching geocoding misses
+"""
+import asyncio
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reddit import geocoding
+
+def _run_lookup(monkeypatch, search_error=None, osm_error=None):
+    """Geocode with stubbed backends that find nothing, returning the cache writes made"""
+    writes = []
+
+    async def fake_cache_get(namespace, key):
+        return None
+
+    async def fake_cache_set(namespace, key, value, ttl):
+        writes.append((namespace, value, ttl))
+
+    async def fake_search(poi_name, city, province, country):
+        await asyncio.sleep(0.01)
+        if search_error:
+            geocoding._note_backend_error(search_error)
+        return None
+
+    async def fake_osm(poi_name, city, province, country):
+        if osm_error:
+            geocoding._note_backend_error(osm_error)
+        return None
+
+    monkeypatch.setattr(geocoding, "acache_get", fake_cache_get)
+    monkeypatch.setattr(geocoding, "acache_set", fake_cache_set)
+    monkeypatch.setattr(geocoding, "_geocode_with_search", fake_search)
+    monkeypatch.setattr(geocoding, "_geocode_osm", fake_osm)
+    assert asyncio.run(geocoding.geocode_with_fallback("Nowhere Cafe", "Toronto", "Ontario", "Canada")) is None
+    return writes
+
+def test_clean_miss_is_cached(monkeypatch):
+    """A miss every backend agreed on is remembered for GEOCODE_MISS_CACHE_TTL"""
+    writes = _run_lookup(monkeypatch)
+    assert writes == [(geocoding.GEOCODE_CACHE, "null", geocoding.GEOCODE_MISS_CACHE_TTL)]
+
+def test_miss_after_search_error_is_not_cached(monkeypatch):
+    """A Serper failure or missing API key keeps the miss out of the cache"""
+    assert _run_lookup(monkeypatch, search_error="Serper: 429 Too Many Requests") == []
+
+def test_miss_after_osm_error_is_not_cached(monkeypatch):
+    """An error in the speculative OSM task is seen by the cache decision"""
+    monkeypatch.setattr(geocoding, "OSM_HEAD_START", 0)
+    assert _run_lookup(monkeypatch, osm_error="OpenStreetMap: timed out") == []
+
+def test_errors_do_not_leak_between_lookups(monkeypatch):
+    """A failed lookup doesn't stop the next clean miss from being cached"""
+    _run_lookup(monkeypatch, search_error="SERPER_API_KEY not set")
+    assert len(_run_lookup(monkeypatch)) == 1
@@ -2,6 +2,7 @@
 """
 Test script for improved geocoding function
 """
+import asyncio
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -66,12 +67,12 @@ def test_geocoding():
         print("-" * 60)
         
         try:
-            coords = geocode_with_fallback(
+            coords = asyncio.run(geocode_with_fallback(
                 test_case['name'],
                 test_case['city'], 
                 test_case['province'],
                 test_case['country']
-            )
+            ))
             
             if coords:
                 print(f"✅ SUCCESS: Found coordinates ({coords['lat']}, {coords['lng']})")
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the cached city bounds check
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import location
+
+def test_failed_bounds_lookup_is_cached(monkeypatch):
+    """A Mapbox failure is remembered, so later bounds checks don't block on another request"""
+    calls = []
+
+    def failing_get(*args, **kwargs):
+        calls.append(args)
+        raise ConnectionError("network unreachable")
+
+    monkeypatch.setenv("MAPBOX_ACCESS_TOKEN", "test-token")
+    monkeypatch.setattr(location.requests, "get", failing_get, raising=False)
+    location.get_city_bbox.cache_clear()
+    try:
+        assert location.is_coordinates_in_city(43.65, -79.38, "Nowhereville")
+        assert location.is_coordinates_in_city(0.0, 0.0, "Nowhereville")
+        assert len(calls) == 1
+    finally:
+        location.get_city_bbox.cache_clear()
@@ -38,7 +38,7 @@ def test_geocoding():
     # Test geocoding fallback
     print(f"🗺️ Testing geocoding fallback for: CN Tower")
     try:
-        coords = geocode_with_fallback("CN Tower", "Toronto", "Ontario", "Canada")
+        coords = asyncio.run(geocode_with_fallback("CN Tower", "Toronto", "Ontario", "Canada"))
         if coords:
             print(f"✅ Geocoding successful: ({coords['lat']}, {coords['lng']})")
         else:
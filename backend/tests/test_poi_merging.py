@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Offline tests for duplicate POI merging
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reddit.models import POI
+from reddit.poi_merging import merge_duplicate_pois, poi_name_key
+
+def _poi(name, context, inline_address=None):
+    return POI(name=name, description="desc", category="attraction", reddit_context=context, inline_address=inline_address)
+
+def test_name_key_ignores_leading_the_and_punctuation():
+    """Spelling variants of one name share a key"""
+    assert poi_name_key("The CN Tower") == poi_name_key("cn-tower") == poi_name_key("  CN Tower ")
+    assert poi_name_key("Casa Loma") != poi_name_key("CN Tower")
+
+def test_name_key_falls_back_for_punctuation_only_names():
+    """A name with no word characters still gets a non-empty key"""
+    assert poi_name_key("!!!") == "!!!"
+
+def test_merge_joins_context_and_keeps_first_address():
+    """Duplicates merge into the first POI, joining context and filling a missing address"""
+    pois = [
+        _poi("The CN Tower", "first", None),
+        _poi("Casa Loma", "castle", "1 Austin Terrace"),
+        _poi("cn-tower", "second", "290 Bremner Blvd"),
+        _poi("CN Tower", "third", "Somewhere else"),
+    ]
+    merged = merge_duplicate_pois(pois)
+    assert [poi.name for poi in merged] == ["The CN Tower", "Casa Loma"]
+    assert merged[0].reddit_context == "first\n---\nsecond\n---\nthird"
+    assert merged[0].inline_address == "290 Bremner Blvd"
+
+def test_merge_does_not_mutate_inputs():
+    """The caller's POIs are left untouched"""
+    pois = [_poi("Casa Loma", "a"), _poi("casa loma", "b")]
+    merge_duplicate_pois(pois)
+    assert pois[0].reddit_context == "a"
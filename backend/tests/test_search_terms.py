@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Offline tests for Reddit search term and search URL building
+"""
+import os
+import sys
+from urllib.parse import parse_qs, urlsplit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reddit.search_terms import build_search_json_url, build_search_url, get_random_search_term, get_search_terms
+
+def test_search_terms_are_stored_unencoded():
+    """Search terms are plain text until a URL is built"""
+    for term in get_search_terms("Toronto") + [get_random_search_term("Toronto")]:
+        assert "%" not in term
+        assert term.endswith(" toronto")
+
+def test_search_url_encodes_term_once():
+    """The browser search URL percent-encodes the term exactly once"""
+    url = build_search_url("toronto", "cool places toronto")
+    assert url == "https://old.reddit.com/r/toronto/search/?q=cool%20places%20toronto&restrict_sr=on&sort=relevance&t=all"
+
+def test_search_json_url_encodes_term_once():
+    """The JSON search request carries the term Reddit should search for, not a re-encoded one"""
+    url = build_search_json_url("toronto", "cool places toronto", 50)
+    assert "%2520" not in url
+    parts = urlsplit(url)
+    assert parts.path == "/r/toronto/search.json"
+    assert parse_qs(parts.query) == {
+        "q": ["cool places toronto"],
+        "restrict_sr": ["on"],
+        "sort": ["relevance"],
+        "t": ["all"],
+        "limit": ["50"],
+    }
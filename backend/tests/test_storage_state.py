@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Offline tests for saving the shared Reddit browser session
+"""
+import asyncio
+import json
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reddit import browser
+
+class FakeContext:
+    def __init__(self, index):
+        self.index = index
+
+    async def storage_state(self):
+        return {"cookies": [{"name": "session", "value": str(self.index) * 5000}], "origins": []}
+
+def test_concurrent_saves_leave_a_complete_file(monkeypatch, tmp_path):
+    """Concurrent scrapes saving the session leave one whole JSON file and no temp files"""
+    state_path = tmp_path / "reddit_storage_state.json"
+    monkeypatch.setattr(browser, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(browser, "STORAGE_STATE_PATH", str(state_path))
+
+    async def run():
+        await asyncio.gather(*(browser.save_storage_state(FakeContext(i)) for i in range(10)))
+
+    asyncio.run(run())
+    with open(state_path) as f:
+        state = json.load(f)
+    assert len(set(state["cookies"][0]["value"])) == 1
+    assert os.listdir(tmp_path) == ["reddit_storage_state.json"]
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Offline tests for Reddit post URL normalization and ranking
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reddit.url_extraction import _normalize_reddit_url, select_relevant_post_urls
+
+def _post(slug):
+    return f"https://old.reddit.com/r/toronto/comments/abc123/{slug}"
+
+def test_normalize_makes_absolute_and_strips_query():
+    """Relative hrefs become absolute old.reddit URLs without query or trailing slash"""
+    assert _normalize_reddit_url("/r/toronto/comments/abc123/slug/?ref=search") == _post("slug")
+    assert _normalize_reddit_url(_post("slug") + "/") == _post("slug")
+
+def test_ranking_prefers_relevant_slugs():
+    """Posts whose slugs look like recommendations come first"""
+    urls = [_post("ttc_delays_again"), _post("best_hidden_gems_to_visit"), _post("cool_spot")]
+    assert select_relevant_post_urls(urls, limit=2) == [_post("best_hidden_gems_to_visit"), _post("cool_spot")]
+
+def test_ranking_keeps_page_order_on_ties():
+    """Equally relevant posts stay in the order they appeared on the page"""
+    urls = [_post("rent_prices"), _post("best_patio"), _post("parking_rant"), _post("best_brunch"), _post("weather")]
+    assert select_relevant_post_urls(urls, limit=5) == [
+        _post("best_patio"), _post("best_brunch"), _post("rent_prices"), _post("parking_rant"), _post("weather")
+    ]
+
+def test_ranking_respects_limit():
+    """No more than limit URLs are returned"""
+    urls = [_post(f"post_{i}") for i in range(10)]
+    assert select_relevant_post_urls(urls, limit=3) == urls[:3]
@@ -1,12 +1,16 @@
+import logging
 import requests
-from typing import Tuple, Dict
+from functools import lru_cache
+from typing import Tuple, Dict, Optional
 import os
 
+logger = logging.getLogger(__name__)
+
 def get_location_details(lat: float, lon: float) -> dict:
     """Get city, province/state, and country using coordinates via Mapbox Geocoding API."""
     mapbox_token = os.getenv("MAPBOX_ACCESS_TOKEN")
     if not mapbox_token:
-        print("⚠️ MAPBOX_ACCESS_TOKEN not found, using fallback")
+        logger.warning("⚠️ MAPBOX_ACCESS_TOKEN not found, using fallback")
         return {
             "city": "Toronto",
             "province": "Ontario", 
@@ -38,14 +42,14 @@ def get_location_details(lat: float, lon: float) -> dict:
                 elif item["id"].startswith("country"):
                     country = item["text"]
             
-            print(f"📍 Found location: {city}, {province}, {country} for coordinates {lat}, {lon}")
+            logger.info("📍 Found location: %s, %s, %s for coordinates %s, %s", city, province, country, lat, lon)
             return {
                 "city": city,
                 "province": province,
                 "country": country
             }
         else:
-            print(f"⚠️ No location found for coordinates {lat}, {lon}")
+            logger.warning("⚠️ No location found for coordinates %s, %s", lat, lon)
             return {
                 "city": "Toronto",
                 "province": "Ontario",
@@ -53,57 +57,62 @@ def get_location_details(lat: float, lon: float) -> dict:
             }
             
     except Exception as e:
-        print(f"❌ Mapbox geocoding error: {e}")
+        logger.error("❌ Mapbox geocoding error: %s", e)
         return {
             "city": "Toronto",
             "province": "Ontario",
             "country": "Canada"
         }
 
-def is_coordinates_in_city(lat: float, lon: float, city_name: str) -> bool:
-    """Check if coordinates are within the detected city bounds."""
+@lru_cache(maxsize=128)
+def get_city_bbox(city_name: str) -> Optional[Tuple[float, float, float, float]]:
+    """Get a city's (min_lon, min_lat, max_lon, max_lat) bounds from Mapbox, cached per city, failures included."""
     mapbox_token = os.getenv("MAPBOX_ACCESS_TOKEN")
-    if not mapbox_token:
-        print("⚠️ MAPBOX_ACCESS_TOKEN not found, skipping city bounds check")
-        return True
+    url = f"https://api.mapbox.com/geocoding/v5/mapbox.places/{city_name}.json"
+    params = {
+        "access_token": mapbox_token,
+        "types": "place",
+        "limit": 1
+    }
     
     try:
-        url = f"https://api.mapbox.com/geocoding/v5/mapbox.places/{city_name}.json"
-        params = {
-            "access_token": mapbox_token,
-            "types": "place",
-            "limit": 1
-        }
-        
         response = requests.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
-        
-        if data.get("features"):
-            feature = data["features"][0]
-            bbox = feature.get("bbox")
-            
-            if bbox:
-                min_lon, min_lat, max_lon, max_lat = bbox
-                
-                in_bounds = (min_lon <= lon <= max_lon) and (min_lat <= lat <= max_lat)
-                
-                if in_bounds:
-                    print(f"✅ Coordinates ({lat}, {lon}) are within {city_name} bounds")
-                else:
-                    print(f"❌ Coordinates ({lat}, {lon}) are outside {city_name} bounds")
-                    print(f"   City bounds: {min_lon}, {min_lat} to {max_lon}, {max_lat}")
-                
-                return in_bounds
-            else:
-                print(f"⚠️ No bounds found for {city_name}, skipping check")
-                return True
-        else:
-            print(f"⚠️ City {city_name} not found, skipping bounds check")
-            return True
-            
     except Exception as e:
-        print(f"❌ Error checking city bounds: {e}")
-        return True
-
+        logger.warning("❌ Error fetching bounds for %s, skipping bounds check: %s", city_name, e)
+        return None
+    
+    if not data.get("features"):
+        logger.warning("⚠️ City %s not found, skipping bounds check", city_name)
+        return None
+    
+    bbox = data["features"][0].get("bbox")
+    if not bbox:
+        logger.warning("⚠️ No bounds found for %s, skipping check", city_name)
+        return None
+    
+    return tuple(bbox)
 
+def is_coordinates_in_city(lat: float, lon: float, city_name: str) -> bool:
+    """Check if coordinates are within the detected city bounds."""
+    mapbox_token = os.getenv("MAPBOX_ACCESS_TOKEN")
+    if not mapbox_token:
+        logger.warning("⚠️ MAPBOX_ACCESS_TOKEN not found, skipping city bounds check")
+        return True
+    
+    bbox = get_city_bbox(city_name)
+    if bbox is None:
+        return True
+    
+    min_lon, min_lat, max_lon, max_lat = bbox
+    
+    in_bounds = (min_lon <= lon <= max_lon) and (min_lat <= lat <= max_lat)
+    
+    if in_bounds:
+        logger.debug("✅ Coordinates (%s, %s) are within %s bounds", lat, lon, city_name)
+    else:
+        logger.debug("❌ Coordinates (%s, %s) are outside %s bounds", lat, lon, city_name)
+        logger.debug("   City bounds: %s, %s to %s, %s", min_lon, min_lat, max_lon, max_lat)
+    
+    return in_bounds